@@ -16,7 +16,8 @@
 #  under the License.
 
 import collections.abc
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,6 +30,7 @@ from typing import (
     MutableMapping,
     Optional,
     Sequence,
+    Type,
     Union,
     cast,
 )
@@ -48,11 +50,77 @@ if TYPE_CHECKING:
     from .search_base import SearchBase
 
 
+def _copy_agg(value: Any) -> Any:
+    """
+    Copy a JSON-like aggregation definition. Plain dicts, lists and scalars
+    are copied directly, anything else is handed over to ``deepcopy``.
+    """
+    if type(value) is dict:
+        return {k: _copy_agg(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_agg(v) for v in value]
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return deepcopy(value)
+
+
+@lru_cache(maxsize=128)
+def _get_agg_class(name: str) -> Type["Agg[Any]"]:
+    # registered aggregation classes are never replaced, so it is safe to
+    # remember the result of the registry lookup
+    return Agg.get_dsl_class(name)
+
+
+def _agg_from_dict(agg: MutableMapping[str, Any]) -> "Agg[Any]":
+    """
+    Build an aggregation out of its dict definition. The dict is consumed in
+    place, so it has to be a copy owned by the caller.
+    """
+    # should be {"terms": {"field": "tags"}}, optionally with aggs and meta
+    if len(agg) - ("aggs" in agg) - ("meta" in agg) != 1:
+        raise ValueError(
+            'A() can only accept dict with an aggregation ({"terms": {...}}). '
+            "Instead it got (%r)" % agg
+        )
+    # pop out nested aggs
+    aggs = agg.pop("aggs", None)
+    # pop out meta data
+    meta = agg.pop("meta", None)
+    agg_type, params = agg.popitem()
+    agg_class = _get_agg_class(agg_type)
+    if aggs:
+        if "aggs" in agg_class._param_defs:
+            # the nested definitions are part of the same copy, build them
+            # directly instead of having A() copy them once more
+            params["aggs"] = {
+                name: (
+                    _agg_from_dict(a)
+                    if isinstance(a, collections.abc.MutableMapping)
+                    else a
+                )
+                for name, a in aggs.items()
+            }
+        else:
+            # aggregations that don't take sub-aggregations keep them as is
+            params["aggs"] = aggs
+    if meta:
+        params["meta"] = meta
+    return agg_class(_expand__to_dot=False, **params)
+
+
 def A(
     name_or_agg: Union[MutableMapping[str, Any], "Agg[_R]", str],
     filter: Optional[Union[str, "Query"]] = None,
     **params: Any,
 ) -> "Agg[_R]":
+    # Terms(...) just return the nested agg
+    if isinstance(name_or_agg, Agg):
+        if params or filter is not None:
+            raise ValueError(
+                "A() cannot accept parameters when passing in an Agg object."
+            )
+        return name_or_agg
+
     if filter is not None:
         if name_or_agg != "filter":
             raise ValueError(
@@ -61,44 +129,24 @@ def A(
             )
         params["filter"] = filter
 
+    # "terms", field="tags"
+    if type(name_or_agg) is str:
+        return _get_agg_class(name_or_agg)(**params)
+
     # {"terms": {"field": "tags"}, "aggs": {...}}
-    if isinstance(name_or_agg, collections.abc.MutableMapping):
+    if type(name_or_agg) is dict or isinstance(
+        name_or_agg, collections.abc.MutableMapping
+    ):
         if params:
             raise ValueError("A() cannot accept parameters when passing in a dict.")
         # copy to avoid modifying in-place
-        agg = deepcopy(name_or_agg)
-        # pop out nested aggs
-        aggs = agg.pop("aggs", None)
-        # pop out meta data
-        meta = agg.pop("meta", None)
-        # should be {"terms": {"field": "tags"}}
-        if len(agg) != 1:
-            raise ValueError(
-                'A() can only accept dict with an aggregation ({"terms": {...}}). '
-                "Instead it got (%r)" % name_or_agg
-            )
-        agg_type, params = agg.popitem()
-        if aggs:
-            params = params.copy()
-            params["aggs"] = aggs
-        if meta:
-            params = params.copy()
-            params["meta"] = meta
-        return Agg[_R].get_dsl_class(agg_type)(_expand__to_dot=False, **params)
+        return _agg_from_dict(_copy_agg(name_or_agg))
 
-    # Terms(...) just return the nested agg
-    elif isinstance(name_or_agg, Agg):
-        if params:
-            raise ValueError(
-                "A() cannot accept parameters when passing in an Agg object."
-            )
-        return name_or_agg
-
-    # "terms", field="tags"
-    return Agg[_R].get_dsl_class(name_or_agg)(**params)
+    return _get_agg_class(name_or_agg)(**params)
 
 
 class Agg(DslBase, Generic[_R]):
+    __slots__ = ()
     _type_name = "agg"
     _type_shortcut = staticmethod(A)
     name = ""
@@ -108,10 +156,14 @@ class Agg(DslBase, Generic[_R]):
 
     def to_dict(self) -> Dict[str, Any]:
         d = super().to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(Dict[str, Any], d[self.name])
+        n = d[self.name]
+        if isinstance(n, dict):
+            # meta and, for bucket aggregations, sub-aggregations are
+            # serialized next to the body
             if "meta" in n:
                 d["meta"] = n.pop("meta")
+            if "aggs" in n and isinstance(self, AggBase):
+                d["aggs"] = n.pop("aggs")
         return d
 
     def result(self, search: "SearchBase[_R]", data: Dict[str, Any]) -> AttrDict[Any]:
@@ -119,6 +171,7 @@ class Agg(DslBase, Generic[_R]):
 
 
 class AggBase(Generic[_R]):
+    __slots__ = ()
     aggs: Dict[str, Agg[_R]]
     _base: Agg[_R]
     _params: Dict[str, Any]
@@ -127,27 +180,38 @@ class AggBase(Generic[_R]):
     }
 
     def __contains__(self, key: str) -> bool:
-        return key in self._params.get("aggs", {})
+        aggs = self._params.get("aggs")
+        return aggs is not None and key in aggs
 
     def __getitem__(self, agg_name: str) -> Agg[_R]:
-        agg = cast(
-            Agg[_R], self._params.setdefault("aggs", {})[agg_name]
-        )  # propagate KeyError
+        # don't materialize an empty "aggs" dict just to look into it
+        aggs = self._params.get("aggs")
+        if aggs is None:
+            raise KeyError(agg_name)
+        agg: Agg[_R] = aggs[agg_name]  # propagate KeyError
 
         # make sure we're not mutating a shared state - whenever accessing a
         # bucket, return a shallow copy of it to be safe
         if isinstance(agg, Bucket):
-            agg = A(agg.name, **agg._params)
+            agg = copy(agg)
+            # copy the containers (sub-aggregations etc.) so that changes to
+            # the copy don't leak back into the original
+            agg._params = {
+                k: v.copy() if isinstance(v, (dict, list)) else v
+                for k, v in agg._params.items()
+            }
+            agg._base = agg
             # be sure to store the copy so any modifications to it will affect us
-            self._params["aggs"][agg_name] = agg
+            aggs[agg_name] = agg
 
         return agg
 
     def __setitem__(self, agg_name: str, agg: Agg[_R]) -> None:
-        self.aggs[agg_name] = A(agg)
+        self._params.setdefault("aggs", {})[agg_name] = A(agg)
 
     def __iter__(self) -> Iterable[str]:
-        return iter(self.aggs)
+        aggs: Iterable[str] = self._params.get("aggs", ())
+        return iter(aggs)
 
     def _agg(
         self,
@@ -157,7 +221,9 @@ class AggBase(Generic[_R]):
         *args: Any,
         **params: Any,
     ) -> Agg[_R]:
-        agg = self[name] = A(agg_type, *args, **params)
+        agg = A(agg_type, *args, **params)
+        # A() has already done all the work __setitem__ would do
+        self._params.setdefault("aggs", {})[name] = agg
 
         # For chaining - when creating new buckets return them...
         if bucket:
@@ -198,22 +264,16 @@ class AggBase(Generic[_R]):
 
 
 class Bucket(AggBase[_R], Agg[_R]):
+    __slots__ = ("_base",)
+
     def __init__(self, **params: Any):
         super().__init__(**params)
         # remember self for chaining
         self._base = self
 
-    def to_dict(self) -> Dict[str, Any]:
-        d = super(AggBase, self).to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(AttrDict[Any], d[self.name])
-            if "aggs" in n:
-                d["aggs"] = n.pop("aggs")
-        return d
-
 
 class Pipeline(Agg[_R]):
-    pass
+    __slots__ = ()
 
 
 class AdjacencyMatrix(Bucket[_R]):
@@ -229,6 +289,7 @@ class AdjacencyMatrix(Bucket[_R]):
         to &.
     """
 
+    __slots__ = ()
     name = "adjacency_matrix"
     _param_defs = {
         "filters": {"type": "query", "hash": True},
@@ -267,6 +328,7 @@ class AutoDateHistogram(Bucket[_R]):
     :arg time_zone: Time zone ID.
     """
 
+    __slots__ = ()
     name = "auto_date_histogram"
 
     def __init__(
@@ -314,6 +376,7 @@ class Avg(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "avg"
 
     def __init__(
@@ -346,6 +409,7 @@ class AvgBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "avg_bucket"
 
     def __init__(
@@ -379,6 +443,7 @@ class Boxplot(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "boxplot"
 
     def __init__(
@@ -415,6 +480,7 @@ class BucketScript(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "bucket_script"
 
     def __init__(
@@ -455,6 +521,7 @@ class BucketSelector(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "bucket_selector"
 
     def __init__(
@@ -492,6 +559,7 @@ class BucketSort(Bucket[_R]):
     :arg sort: The list of fields to sort on.
     """
 
+    __slots__ = ()
     name = "bucket_sort"
 
     def __init__(
@@ -545,6 +613,7 @@ class BucketCountKsTest(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "bucket_count_ks_test"
 
     def __init__(
@@ -577,6 +646,7 @@ class BucketCorrelation(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "bucket_correlation"
 
     def __init__(
@@ -610,6 +680,7 @@ class Cardinality(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "cardinality"
 
     def __init__(
@@ -692,6 +763,7 @@ class CategorizeText(Bucket[_R]):
         to be returned from the shard before merging.
     """
 
+    __slots__ = ()
     name = "categorize_text"
 
     def __init__(
@@ -734,6 +806,7 @@ class Children(Bucket[_R]):
     :arg type: The child type that should be selected.
     """
 
+    __slots__ = ()
     name = "children"
 
     def __init__(self, type: Union[str, "DefaultType"] = DEFAULT, **kwargs: Any):
@@ -755,6 +828,7 @@ class Composite(Bucket[_R]):
         are returned in the order of the `sources` definition.
     """
 
+    __slots__ = ()
     name = "composite"
 
     def __init__(
@@ -787,6 +861,7 @@ class CumulativeCardinality(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "cumulative_cardinality"
 
     def __init__(
@@ -821,6 +896,7 @@ class CumulativeSum(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "cumulative_sum"
 
     def __init__(
@@ -875,6 +951,7 @@ class DateHistogram(Bucket[_R]):
         bucket and return the ranges as a hash rather than an array.
     """
 
+    __slots__ = ()
     name = "date_histogram"
 
     def __init__(
@@ -950,6 +1027,7 @@ class DateRange(Bucket[_R]):
         bucket and returns the ranges as a hash rather than an array.
     """
 
+    __slots__ = ()
     name = "date_range"
 
     def __init__(
@@ -993,6 +1071,7 @@ class Derivative(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "derivative"
 
     def __init__(
@@ -1030,6 +1109,7 @@ class DiversifiedSampler(Bucket[_R]):
     :arg field: The field used to provide values used for de-duplication.
     """
 
+    __slots__ = ()
     name = "diversified_sampler"
 
     def __init__(
@@ -1068,6 +1148,7 @@ class ExtendedStats(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "extended_stats"
 
     def __init__(
@@ -1106,6 +1187,7 @@ class ExtendedStatsBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "extended_stats_bucket"
 
     def __init__(
@@ -1146,6 +1228,7 @@ class FrequentItemSets(Agg[_R]):
     :arg filter: Query that filters documents from analysis.
     """
 
+    __slots__ = ()
     name = "frequent_item_sets"
     _param_defs = {
         "filter": {"type": "query"},
@@ -1184,6 +1267,7 @@ class Filter(Bucket[_R]):
         documents to those that match a query.
     """
 
+    __slots__ = ()
     name = "filter"
     _param_defs = {
         "filter": {"type": "query"},
@@ -1195,9 +1279,13 @@ class Filter(Bucket[_R]):
 
     def to_dict(self) -> Dict[str, Any]:
         d = super().to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(AttrDict[Any], d[self.name])
-            n.update(n.pop("filter", {}))
+        n = d[self.name]
+        if isinstance(n, dict) and "filter" in n:
+            if len(n) == 1:
+                # the query makes up the whole body, use it as is
+                d[self.name] = n["filter"]
+            else:
+                n.update(n.pop("filter"))
         return d
 
 
@@ -1217,6 +1305,7 @@ class Filters(Bucket[_R]):
         array of objects. Defaults to `True` if omitted.
     """
 
+    __slots__ = ()
     name = "filters"
     _param_defs = {
         "filters": {"type": "query", "hash": True},
@@ -1255,6 +1344,7 @@ class GeoBounds(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "geo_bounds"
 
     def __init__(
@@ -1288,6 +1378,7 @@ class GeoCentroid(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "geo_centroid"
 
     def __init__(
@@ -1332,6 +1423,7 @@ class GeoDistance(Bucket[_R]):
     :arg unit: The distance unit. Defaults to `m` if omitted.
     """
 
+    __slots__ = ()
     name = "geo_distance"
 
     def __init__(
@@ -1385,6 +1477,7 @@ class GeohashGrid(Bucket[_R]):
         to `10000` if omitted.
     """
 
+    __slots__ = ()
     name = "geohash_grid"
 
     def __init__(
@@ -1433,6 +1526,7 @@ class GeoLine(Agg[_R]):
         `10000` if omitted.
     """
 
+    __slots__ = ()
     name = "geo_line"
 
     def __init__(
@@ -1477,6 +1571,7 @@ class GeotileGrid(Bucket[_R]):
         each bucket.
     """
 
+    __slots__ = ()
     name = "geotile_grid"
 
     def __init__(
@@ -1525,6 +1620,7 @@ class GeohexGrid(Bucket[_R]):
     :arg shard_size: Number of buckets returned from each shard.
     """
 
+    __slots__ = ()
     name = "geohex_grid"
 
     def __init__(
@@ -1562,11 +1658,9 @@ class Global(Bucket[_R]):
     search query itself.
     """
 
+    __slots__ = ()
     name = "global"
 
-    def __init__(self, **kwargs: Any):
-        super().__init__(**kwargs)
-
 
 class Histogram(Bucket[_R]):
     """
@@ -1598,6 +1692,7 @@ class Histogram(Bucket[_R]):
         keyed by the bucket keys.
     """
 
+    __slots__ = ()
     name = "histogram"
 
     def __init__(
@@ -1652,6 +1747,7 @@ class IPRange(Bucket[_R]):
     :arg ranges: Array of IP ranges.
     """
 
+    __slots__ = ()
     name = "ip_range"
 
     def __init__(
@@ -1687,6 +1783,7 @@ class IPPrefix(Bucket[_R]):
         be included in the response. Defaults to `1` if omitted.
     """
 
+    __slots__ = ()
     name = "ip_prefix"
 
     def __init__(
@@ -1728,6 +1825,7 @@ class Inference(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "inference"
 
     def __init__(
@@ -1772,6 +1870,7 @@ class Line(Agg[_R]):
         `10000` if omitted.
     """
 
+    __slots__ = ()
     name = "line"
 
     def __init__(
@@ -1807,6 +1906,7 @@ class MatrixStats(Agg[_R]):
         value. By default, documents without a value are ignored.
     """
 
+    __slots__ = ()
     name = "matrix_stats"
 
     def __init__(
@@ -1840,6 +1940,7 @@ class Max(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "max"
 
     def __init__(
@@ -1871,6 +1972,7 @@ class MaxBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "max_bucket"
 
     def __init__(
@@ -1906,6 +2008,7 @@ class MedianAbsoluteDeviation(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "median_absolute_deviation"
 
     def __init__(
@@ -1940,6 +2043,7 @@ class Min(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "min"
 
     def __init__(
@@ -1971,6 +2075,7 @@ class MinBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "min_bucket"
 
     def __init__(
@@ -2001,6 +2106,7 @@ class Missing(Bucket[_R]):
     :arg missing:
     """
 
+    __slots__ = ()
     name = "missing"
 
     def __init__(
@@ -2016,11 +2122,9 @@ class Missing(Bucket[_R]):
 class MovingAvg(Pipeline[_R]):
     """ """
 
+    __slots__ = ()
     name = "moving_avg"
 
-    def __init__(self, **kwargs: Any):
-        super().__init__(**kwargs)
-
 
 class LinearMovingAverageAggregation(MovingAvg[_R]):
     """
@@ -2038,6 +2142,8 @@ class LinearMovingAverageAggregation(MovingAvg[_R]):
         to correlate.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -2084,6 +2190,8 @@ class SimpleMovingAverageAggregation(MovingAvg[_R]):
         to correlate.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -2130,6 +2238,8 @@ class EwmaMovingAverageAggregation(MovingAvg[_R]):
         to correlate.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -2178,6 +2288,8 @@ class HoltMovingAverageAggregation(MovingAvg[_R]):
         to correlate.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -2226,6 +2338,8 @@ class HoltWintersMovingAverageAggregation(MovingAvg[_R]):
         to correlate.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -2277,6 +2391,7 @@ class MovingPercentiles(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "moving_percentiles"
 
     def __init__(
@@ -2327,6 +2442,7 @@ class MovingFn(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "moving_fn"
 
     def __init__(
@@ -2378,6 +2494,7 @@ class MultiTerms(Bucket[_R]):
         overall terms list. Defaults to `10` if omitted.
     """
 
+    __slots__ = ()
     name = "multi_terms"
 
     def __init__(
@@ -2422,6 +2539,7 @@ class Nested(Bucket[_R]):
     :arg path: The path to the field of type `nested`.
     """
 
+    __slots__ = ()
     name = "nested"
 
     def __init__(
@@ -2447,6 +2565,7 @@ class Normalize(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "normalize"
 
     def __init__(
@@ -2489,6 +2608,7 @@ class Parent(Bucket[_R]):
     :arg type: The child type that should be selected.
     """
 
+    __slots__ = ()
     name = "parent"
 
     def __init__(self, type: Union[str, "DefaultType"] = DEFAULT, **kwargs: Any):
@@ -2518,6 +2638,7 @@ class PercentileRanks(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "percentile_ranks"
 
     def __init__(
@@ -2568,6 +2689,7 @@ class Percentiles(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "percentiles"
 
     def __init__(
@@ -2611,6 +2733,7 @@ class PercentilesBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "percentiles_bucket"
 
     def __init__(
@@ -2650,6 +2773,7 @@ class Range(Bucket[_R]):
     :arg format:
     """
 
+    __slots__ = ()
     name = "range"
 
     def __init__(
@@ -2695,6 +2819,7 @@ class RareTerms(Bucket[_R]):
     :arg value_type:
     """
 
+    __slots__ = ()
     name = "rare_terms"
 
     def __init__(
@@ -2738,6 +2863,7 @@ class Rate(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "rate"
 
     def __init__(
@@ -2778,6 +2904,7 @@ class ReverseNested(Bucket[_R]):
         root/main document level.
     """
 
+    __slots__ = ()
     name = "reverse_nested"
 
     def __init__(
@@ -2806,6 +2933,7 @@ class RandomSampler(Bucket[_R]):
         same.
     """
 
+    __slots__ = ()
     name = "random_sampler"
 
     def __init__(
@@ -2831,6 +2959,7 @@ class Sampler(Bucket[_R]):
         omitted.
     """
 
+    __slots__ = ()
     name = "sampler"
 
     def __init__(self, shard_size: Union[int, "DefaultType"] = DEFAULT, **kwargs: Any):
@@ -2861,6 +2990,7 @@ class ScriptedMetric(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "scripted_metric"
 
     def __init__(
@@ -2905,6 +3035,7 @@ class SerialDiff(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "serial_diff"
 
     def __init__(
@@ -2970,6 +3101,7 @@ class SignificantTerms(Bucket[_R]):
         list.
     """
 
+    __slots__ = ()
     name = "significant_terms"
     _param_defs = {
         "background_filter": {"type": "query"},
@@ -3080,6 +3212,7 @@ class SignificantText(Bucket[_R]):
         text will be analyzed.
     """
 
+    __slots__ = ()
     name = "significant_text"
     _param_defs = {
         "background_filter": {"type": "query"},
@@ -3165,6 +3298,7 @@ class Stats(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "stats"
 
     def __init__(
@@ -3195,6 +3329,7 @@ class StatsBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "stats_bucket"
 
     def __init__(
@@ -3227,6 +3362,7 @@ class StringStats(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "string_stats"
 
     def __init__(
@@ -3259,6 +3395,7 @@ class Sum(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "sum"
 
     def __init__(
@@ -3289,6 +3426,7 @@ class SumBucket(Pipeline[_R]):
         to correlate.
     """
 
+    __slots__ = ()
     name = "sum_bucket"
 
     def __init__(
@@ -3348,6 +3486,7 @@ class Terms(Bucket[_R]):
     :arg format:
     """
 
+    __slots__ = ()
     name = "terms"
 
     def __init__(
@@ -3428,6 +3567,7 @@ class TimeSeries(Bucket[_R]):
         bucket and returns the ranges as a hash rather than an array.
     """
 
+    __slots__ = ()
     name = "time_series"
 
     def __init__(
@@ -3475,6 +3615,7 @@ class TopHits(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "top_hits"
 
     def __init__(
@@ -3551,6 +3692,7 @@ class TTest(Agg[_R]):
     :arg type: The type of test. Defaults to `heteroscedastic` if omitted.
     """
 
+    __slots__ = ()
     name = "t_test"
 
     def __init__(
@@ -3581,6 +3723,7 @@ class TopMetrics(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "top_metrics"
 
     def __init__(
@@ -3627,6 +3770,7 @@ class ValueCount(Agg[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "value_count"
 
     def __init__(
@@ -3655,6 +3799,7 @@ class WeightedAvg(Agg[_R]):
         weights.
     """
 
+    __slots__ = ()
     name = "weighted_avg"
 
     def __init__(
@@ -3706,6 +3851,7 @@ class VariableWidthHistogram(Bucket[_R]):
     :arg script:
     """
 
+    __slots__ = ()
     name = "variable_width_histogram"
 
     def __init__(
@@ -167,14 +167,14 @@ class DecayFunction(AttrDict[Any]):
         ] = DEFAULT,
         **kwargs: Any,
     ):
-        if decay != DEFAULT:
+        if decay is not DEFAULT:
             kwargs["decay"] = decay
-        if offset != DEFAULT:
+        if offset is not DEFAULT:
             kwargs["offset"] = offset
-        if scale != DEFAULT:
+        if scale is not DEFAULT:
             kwargs["scale"] = scale
-        if origin != DEFAULT:
+        if origin is not DEFAULT:
             kwargs["origin"] = origin
-        if multi_value_mode != DEFAULT:
+        if multi_value_mode is not DEFAULT:
             kwargs["multi_value_mode"] = multi_value_mode
         super().__init__(kwargs)
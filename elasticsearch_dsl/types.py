@@ -15,6 +15,8 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from __future__ import annotations
+
 from typing import Any, Dict, Literal, Mapping, Sequence, Union
 
 from elastic_transport.client_utils import DEFAULT, DefaultType
@@ -25,6 +27,10 @@ from elasticsearch_dsl.utils import AttrDict
 
 PipeSeparatedFlags = str
 
+# classes that inherit directly from AttrDict call its __init__ without going
+# through super()
+_attrdict_init = AttrDict.__init__
+
 
 class AggregationRange(AttrDict[Any]):
     """
@@ -33,6 +39,8 @@ class AggregationRange(AttrDict[Any]):
     :arg to: End of the range (exclusive).
     """
 
+    __slots__ = ()
+
     from_: Union[float, None, DefaultType]
     key: Union[str, DefaultType]
     to: Union[float, None, DefaultType]
@@ -51,7 +59,7 @@ class AggregationRange(AttrDict[Any]):
             kwargs["key"] = key
         if to is not DEFAULT:
             kwargs["to"] = to
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class BucketCorrelationFunction(AttrDict[Any]):
@@ -61,21 +69,23 @@ class BucketCorrelationFunction(AttrDict[Any]):
         correlation of a term value and a given metric.
     """
 
+    __slots__ = ()
+
     count_correlation: Union[
-        "BucketCorrelationFunctionCountCorrelation", Dict[str, Any], DefaultType
+        BucketCorrelationFunctionCountCorrelation, Dict[str, Any], DefaultType
     ]
 
     def __init__(
         self,
         *,
         count_correlation: Union[
-            "BucketCorrelationFunctionCountCorrelation", Dict[str, Any], DefaultType
+            BucketCorrelationFunctionCountCorrelation, Dict[str, Any], DefaultType
         ] = DEFAULT,
         **kwargs: Any,
     ):
         if count_correlation is not DEFAULT:
             kwargs["count_correlation"] = count_correlation
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class BucketCorrelationFunctionCountCorrelation(AttrDict[Any]):
@@ -84,8 +94,10 @@ class BucketCorrelationFunctionCountCorrelation(AttrDict[Any]):
         configured `bucket_path` values.
     """
 
+    __slots__ = ()
+
     indicator: Union[
-        "BucketCorrelationFunctionCountCorrelationIndicator",
+        BucketCorrelationFunctionCountCorrelationIndicator,
         Dict[str, Any],
         DefaultType,
     ]
@@ -94,7 +106,7 @@ class BucketCorrelationFunctionCountCorrelation(AttrDict[Any]):
         self,
         *,
         indicator: Union[
-            "BucketCorrelationFunctionCountCorrelationIndicator",
+            BucketCorrelationFunctionCountCorrelationIndicator,
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
@@ -102,7 +114,7 @@ class BucketCorrelationFunctionCountCorrelation(AttrDict[Any]):
     ):
         if indicator is not DEFAULT:
             kwargs["indicator"] = indicator
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class BucketCorrelationFunctionCountCorrelationIndicator(AttrDict[Any]):
@@ -122,6 +134,8 @@ class BucketCorrelationFunctionCountCorrelationIndicator(AttrDict[Any]):
         fractions, if provided, must equal expectations.
     """
 
+    __slots__ = ()
+
     doc_count: Union[int, DefaultType]
     expectations: Union[Sequence[float], DefaultType]
     fractions: Union[Sequence[float], DefaultType]
@@ -140,7 +154,7 @@ class BucketCorrelationFunctionCountCorrelationIndicator(AttrDict[Any]):
             kwargs["expectations"] = expectations
         if fractions is not DEFAULT:
             kwargs["fractions"] = fractions
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ChiSquareHeuristic(AttrDict[Any]):
@@ -153,6 +167,8 @@ class ChiSquareHeuristic(AttrDict[Any]):
         outside the subset.
     """
 
+    __slots__ = ()
+
     background_is_superset: Union[bool, DefaultType]
     include_negatives: Union[bool, DefaultType]
 
@@ -167,7 +183,7 @@ class ChiSquareHeuristic(AttrDict[Any]):
             kwargs["background_is_superset"] = background_is_superset
         if include_negatives is not DEFAULT:
             kwargs["include_negatives"] = include_negatives
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ClassificationInferenceOptions(AttrDict[Any]):
@@ -185,6 +201,8 @@ class ClassificationInferenceOptions(AttrDict[Any]):
         classes are written. Defaults to top_classes.
     """
 
+    __slots__ = ()
+
     num_top_classes: Union[int, DefaultType]
     num_top_feature_importance_values: Union[int, DefaultType]
     prediction_field_type: Union[str, DefaultType]
@@ -213,7 +231,7 @@ class ClassificationInferenceOptions(AttrDict[Any]):
             kwargs["results_field"] = results_field
         if top_classes_results_field is not DEFAULT:
             kwargs["top_classes_results_field"] = top_classes_results_field
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class CommonTermsQuery(AttrDict[Any]):
@@ -232,6 +250,8 @@ class CommonTermsQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     query: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     cutoff_frequency: Union[float, DefaultType]
@@ -270,7 +290,7 @@ class CommonTermsQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class CoordsGeoBounds(AttrDict[Any]):
@@ -281,6 +301,8 @@ class CoordsGeoBounds(AttrDict[Any]):
     :arg right: (required)
     """
 
+    __slots__ = ()
+
     top: Union[float, DefaultType]
     bottom: Union[float, DefaultType]
     left: Union[float, DefaultType]
@@ -303,7 +325,7 @@ class CoordsGeoBounds(AttrDict[Any]):
             kwargs["left"] = left
         if right is not DEFAULT:
             kwargs["right"] = right
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class CustomCategorizeTextAnalyzer(AttrDict[Any]):
@@ -313,6 +335,8 @@ class CustomCategorizeTextAnalyzer(AttrDict[Any]):
     :arg filter:
     """
 
+    __slots__ = ()
+
     char_filter: Union[Sequence[str], DefaultType]
     tokenizer: Union[str, DefaultType]
     filter: Union[Sequence[str], DefaultType]
@@ -331,7 +355,7 @@ class CustomCategorizeTextAnalyzer(AttrDict[Any]):
             kwargs["tokenizer"] = tokenizer
         if filter is not DEFAULT:
             kwargs["filter"] = filter
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class DateRangeExpression(AttrDict[Any]):
@@ -341,6 +365,8 @@ class DateRangeExpression(AttrDict[Any]):
     :arg to: End of the range (exclusive).
     """
 
+    __slots__ = ()
+
     from_: Union[str, float, DefaultType]
     key: Union[str, DefaultType]
     to: Union[str, float, DefaultType]
@@ -359,7 +385,7 @@ class DateRangeExpression(AttrDict[Any]):
             kwargs["key"] = key
         if to is not DEFAULT:
             kwargs["to"] = to
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class EmptyObject(AttrDict[Any]):
@@ -367,8 +393,10 @@ class EmptyObject(AttrDict[Any]):
     For empty Class assignments
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any):
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class EwmaModelSettings(AttrDict[Any]):
@@ -376,12 +404,14 @@ class EwmaModelSettings(AttrDict[Any]):
     :arg alpha:
     """
 
+    __slots__ = ()
+
     alpha: Union[float, DefaultType]
 
     def __init__(self, *, alpha: Union[float, DefaultType] = DEFAULT, **kwargs: Any):
         if alpha is not DEFAULT:
             kwargs["alpha"] = alpha
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ExtendedBounds(AttrDict[Any]):
@@ -390,6 +420,8 @@ class ExtendedBounds(AttrDict[Any]):
     :arg min: Minimum value for the bound.
     """
 
+    __slots__ = ()
+
     max: Any
     min: Any
 
@@ -398,7 +430,7 @@ class ExtendedBounds(AttrDict[Any]):
             kwargs["max"] = max
         if min is not DEFAULT:
             kwargs["min"] = min
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FieldAndFormat(AttrDict[Any]):
@@ -412,6 +444,8 @@ class FieldAndFormat(AttrDict[Any]):
     :arg include_unmapped:
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
     format: Union[str, DefaultType]
     include_unmapped: Union[bool, DefaultType]
@@ -430,7 +464,7 @@ class FieldAndFormat(AttrDict[Any]):
             kwargs["format"] = format
         if include_unmapped is not DEFAULT:
             kwargs["include_unmapped"] = include_unmapped
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FieldCollapse(AttrDict[Any]):
@@ -442,22 +476,24 @@ class FieldCollapse(AttrDict[Any]):
     :arg collapse:
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
     inner_hits: Union[
-        "InnerHits", Sequence["InnerHits"], Sequence[Dict[str, Any]], DefaultType
+        InnerHits, Sequence[InnerHits], Sequence[Dict[str, Any]], DefaultType
     ]
     max_concurrent_group_searches: Union[int, DefaultType]
-    collapse: Union["FieldCollapse", Dict[str, Any], DefaultType]
+    collapse: Union[FieldCollapse, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
         inner_hits: Union[
-            "InnerHits", Sequence["InnerHits"], Sequence[Dict[str, Any]], DefaultType
+            InnerHits, Sequence[InnerHits], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
         max_concurrent_group_searches: Union[int, DefaultType] = DEFAULT,
-        collapse: Union["FieldCollapse", Dict[str, Any], DefaultType] = DEFAULT,
+        collapse: Union[FieldCollapse, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if field is not DEFAULT:
@@ -468,7 +504,7 @@ class FieldCollapse(AttrDict[Any]):
             kwargs["max_concurrent_group_searches"] = max_concurrent_group_searches
         if collapse is not DEFAULT:
             kwargs["collapse"] = collapse
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FieldLookup(AttrDict[Any]):
@@ -479,6 +515,8 @@ class FieldLookup(AttrDict[Any]):
     :arg routing: Custom routing value.
     """
 
+    __slots__ = ()
+
     id: Union[str, DefaultType]
     index: Union[str, DefaultType]
     path: Union[str, InstrumentedField, DefaultType]
@@ -501,7 +539,7 @@ class FieldLookup(AttrDict[Any]):
             kwargs["path"] = str(path)
         if routing is not DEFAULT:
             kwargs["routing"] = routing
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FieldSort(AttrDict[Any]):
@@ -515,9 +553,11 @@ class FieldSort(AttrDict[Any]):
     :arg format:
     """
 
+    __slots__ = ()
+
     missing: Union[str, int, float, bool, DefaultType]
     mode: Union[Literal["min", "max", "sum", "avg", "median"], DefaultType]
-    nested: Union["NestedSortValue", Dict[str, Any], DefaultType]
+    nested: Union[NestedSortValue, Dict[str, Any], DefaultType]
     order: Union[Literal["asc", "desc"], DefaultType]
     unmapped_type: Union[
         Literal[
@@ -580,7 +620,7 @@ class FieldSort(AttrDict[Any]):
         mode: Union[
             Literal["min", "max", "sum", "avg", "median"], DefaultType
         ] = DEFAULT,
-        nested: Union["NestedSortValue", Dict[str, Any], DefaultType] = DEFAULT,
+        nested: Union[NestedSortValue, Dict[str, Any], DefaultType] = DEFAULT,
         order: Union[Literal["asc", "desc"], DefaultType] = DEFAULT,
         unmapped_type: Union[
             Literal[
@@ -653,7 +693,7 @@ class FieldSort(AttrDict[Any]):
             kwargs["numeric_type"] = numeric_type
         if format is not DEFAULT:
             kwargs["format"] = format
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FrequentItemSetsField(AttrDict[Any]):
@@ -665,9 +705,11 @@ class FrequentItemSetsField(AttrDict[Any]):
         arrays of strings of exact terms.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
     exclude: Union[str, Sequence[str], DefaultType]
-    include: Union[str, Sequence[str], "TermsPartition", Dict[str, Any], DefaultType]
+    include: Union[str, Sequence[str], TermsPartition, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
@@ -675,7 +717,7 @@ class FrequentItemSetsField(AttrDict[Any]):
         field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
         exclude: Union[str, Sequence[str], DefaultType] = DEFAULT,
         include: Union[
-            str, Sequence[str], "TermsPartition", Dict[str, Any], DefaultType
+            str, Sequence[str], TermsPartition, Dict[str, Any], DefaultType
         ] = DEFAULT,
         **kwargs: Any,
     ):
@@ -685,7 +727,7 @@ class FrequentItemSetsField(AttrDict[Any]):
             kwargs["exclude"] = exclude
         if include is not DEFAULT:
             kwargs["include"] = include
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class FuzzyQuery(AttrDict[Any]):
@@ -709,6 +751,8 @@ class FuzzyQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     value: Union[str, float, bool, DefaultType]
     max_expansions: Union[int, DefaultType]
     prefix_length: Union[int, DefaultType]
@@ -747,7 +791,7 @@ class FuzzyQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoDistanceSort(AttrDict[Any]):
@@ -762,12 +806,14 @@ class GeoDistanceSort(AttrDict[Any]):
     :arg nested:
     """
 
-    _field: Union[str, "InstrumentedField", "DefaultType"]
+    __slots__ = ()
+
+    _field: Union[str, InstrumentedField, DefaultType]
     _value: Union[
-        Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str],
-        Sequence[Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]],
+        Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str],
+        Sequence[Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]],
         Dict[str, Any],
-        "DefaultType",
+        DefaultType,
     ]
     mode: Union[Literal["min", "max", "sum", "avg", "median"], DefaultType]
     distance_type: Union[Literal["arc", "plane"], DefaultType]
@@ -776,18 +822,16 @@ class GeoDistanceSort(AttrDict[Any]):
     unit: Union[
         Literal["in", "ft", "yd", "mi", "nmi", "km", "m", "cm", "mm"], DefaultType
     ]
-    nested: Union["NestedSortValue", Dict[str, Any], DefaultType]
+    nested: Union[NestedSortValue, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
-        _field: Union[str, "InstrumentedField", "DefaultType"] = DEFAULT,
+        _field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
         _value: Union[
-            Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str],
-            Sequence[
-                Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]
-            ],
+            Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str],
+            Sequence[Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]],
             Dict[str, Any],
-            "DefaultType",
+            DefaultType,
         ] = DEFAULT,
         *,
         mode: Union[
@@ -799,7 +843,7 @@ class GeoDistanceSort(AttrDict[Any]):
         unit: Union[
             Literal["in", "ft", "yd", "mi", "nmi", "km", "m", "cm", "mm"], DefaultType
         ] = DEFAULT,
-        nested: Union["NestedSortValue", Dict[str, Any], DefaultType] = DEFAULT,
+        nested: Union[NestedSortValue, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if _field is not DEFAULT:
@@ -816,7 +860,7 @@ class GeoDistanceSort(AttrDict[Any]):
             kwargs["unit"] = unit
         if nested is not DEFAULT:
             kwargs["nested"] = nested
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoHashLocation(AttrDict[Any]):
@@ -824,12 +868,14 @@ class GeoHashLocation(AttrDict[Any]):
     :arg geohash: (required)
     """
 
+    __slots__ = ()
+
     geohash: Union[str, DefaultType]
 
     def __init__(self, *, geohash: Union[str, DefaultType] = DEFAULT, **kwargs: Any):
         if geohash is not DEFAULT:
             kwargs["geohash"] = geohash
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoLinePoint(AttrDict[Any]):
@@ -837,6 +883,8 @@ class GeoLinePoint(AttrDict[Any]):
     :arg field: (required) The name of the geo_point field.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
 
     def __init__(
@@ -847,7 +895,7 @@ class GeoLinePoint(AttrDict[Any]):
     ):
         if field is not DEFAULT:
             kwargs["field"] = str(field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoLineSort(AttrDict[Any]):
@@ -856,6 +904,8 @@ class GeoLineSort(AttrDict[Any]):
         sort key for ordering the points.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
 
     def __init__(
@@ -866,7 +916,7 @@ class GeoLineSort(AttrDict[Any]):
     ):
         if field is not DEFAULT:
             kwargs["field"] = str(field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoPolygonPoints(AttrDict[Any]):
@@ -874,8 +924,10 @@ class GeoPolygonPoints(AttrDict[Any]):
     :arg points: (required)
     """
 
+    __slots__ = ()
+
     points: Union[
-        Sequence[Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]],
+        Sequence[Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]],
         Dict[str, Any],
         DefaultType,
     ]
@@ -884,9 +936,7 @@ class GeoPolygonPoints(AttrDict[Any]):
         self,
         *,
         points: Union[
-            Sequence[
-                Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]
-            ],
+            Sequence[Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]],
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
@@ -894,7 +944,7 @@ class GeoPolygonPoints(AttrDict[Any]):
     ):
         if points is not DEFAULT:
             kwargs["points"] = points
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GeoShapeFieldQuery(AttrDict[Any]):
@@ -906,8 +956,10 @@ class GeoShapeFieldQuery(AttrDict[Any]):
         Defaults to `intersects` if omitted.
     """
 
+    __slots__ = ()
+
     shape: Any
-    indexed_shape: Union["FieldLookup", Dict[str, Any], DefaultType]
+    indexed_shape: Union[FieldLookup, Dict[str, Any], DefaultType]
     relation: Union[
         Literal["intersects", "disjoint", "within", "contains"], DefaultType
     ]
@@ -916,7 +968,7 @@ class GeoShapeFieldQuery(AttrDict[Any]):
         self,
         *,
         shape: Any = DEFAULT,
-        indexed_shape: Union["FieldLookup", Dict[str, Any], DefaultType] = DEFAULT,
+        indexed_shape: Union[FieldLookup, Dict[str, Any], DefaultType] = DEFAULT,
         relation: Union[
             Literal["intersects", "disjoint", "within", "contains"], DefaultType
         ] = DEFAULT,
@@ -928,7 +980,7 @@ class GeoShapeFieldQuery(AttrDict[Any]):
             kwargs["indexed_shape"] = indexed_shape
         if relation is not DEFAULT:
             kwargs["relation"] = relation
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class GoogleNormalizedDistanceHeuristic(AttrDict[Any]):
@@ -938,6 +990,8 @@ class GoogleNormalizedDistanceHeuristic(AttrDict[Any]):
         that you want to compare to.
     """
 
+    __slots__ = ()
+
     background_is_superset: Union[bool, DefaultType]
 
     def __init__(
@@ -948,7 +1002,7 @@ class GoogleNormalizedDistanceHeuristic(AttrDict[Any]):
     ):
         if background_is_superset is not DEFAULT:
             kwargs["background_is_superset"] = background_is_superset
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class HdrMethod(AttrDict[Any]):
@@ -957,6 +1011,8 @@ class HdrMethod(AttrDict[Any]):
         values for the histogram in number of significant digits.
     """
 
+    __slots__ = ()
+
     number_of_significant_value_digits: Union[int, DefaultType]
 
     def __init__(
@@ -969,7 +1025,7 @@ class HdrMethod(AttrDict[Any]):
             kwargs["number_of_significant_value_digits"] = (
                 number_of_significant_value_digits
             )
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class Highlight(AttrDict[Any]):
@@ -1043,8 +1099,10 @@ class Highlight(AttrDict[Any]):
     :arg tags_schema: Set to `styled` to use the built-in tag schema.
     """
 
+    __slots__ = ()
+
     fields: Union[
-        Mapping[Union[str, InstrumentedField], "HighlightField"],
+        Mapping[Union[str, InstrumentedField], HighlightField],
         Dict[str, Any],
         DefaultType,
     ]
@@ -1075,7 +1133,7 @@ class Highlight(AttrDict[Any]):
         self,
         *,
         fields: Union[
-            Mapping[Union[str, InstrumentedField], "HighlightField"],
+            Mapping[Union[str, InstrumentedField], HighlightField],
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
@@ -1106,7 +1164,7 @@ class Highlight(AttrDict[Any]):
         **kwargs: Any,
     ):
         if fields is not DEFAULT:
-            kwargs["fields"] = str(fields)
+            kwargs["fields"] = {str(k): v for k, v in fields.items()}
         if encoder is not DEFAULT:
             kwargs["encoder"] = encoder
         if type is not DEFAULT:
@@ -1151,7 +1209,7 @@ class Highlight(AttrDict[Any]):
             kwargs["require_field_match"] = require_field_match
         if tags_schema is not DEFAULT:
             kwargs["tags_schema"] = tags_schema
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class HighlightField(AttrDict[Any]):
@@ -1225,6 +1283,8 @@ class HighlightField(AttrDict[Any]):
     :arg tags_schema: Set to `styled` to use the built-in tag schema.
     """
 
+    __slots__ = ()
+
     fragment_offset: Union[int, DefaultType]
     matched_fields: Union[
         Union[str, InstrumentedField],
@@ -1290,7 +1350,11 @@ class HighlightField(AttrDict[Any]):
         if fragment_offset is not DEFAULT:
             kwargs["fragment_offset"] = fragment_offset
         if matched_fields is not DEFAULT:
-            kwargs["matched_fields"] = str(matched_fields)
+            kwargs["matched_fields"] = (
+                str(matched_fields)
+                if isinstance(matched_fields, (str, InstrumentedField))
+                else [str(f) for f in matched_fields]
+            )
         if type is not DEFAULT:
             kwargs["type"] = type
         if boundary_chars is not DEFAULT:
@@ -1333,7 +1397,7 @@ class HighlightField(AttrDict[Any]):
             kwargs["require_field_match"] = require_field_match
         if tags_schema is not DEFAULT:
             kwargs["tags_schema"] = tags_schema
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class HoltLinearModelSettings(AttrDict[Any]):
@@ -1342,6 +1406,8 @@ class HoltLinearModelSettings(AttrDict[Any]):
     :arg beta:
     """
 
+    __slots__ = ()
+
     alpha: Union[float, DefaultType]
     beta: Union[float, DefaultType]
 
@@ -1356,7 +1422,7 @@ class HoltLinearModelSettings(AttrDict[Any]):
             kwargs["alpha"] = alpha
         if beta is not DEFAULT:
             kwargs["beta"] = beta
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class HoltWintersModelSettings(AttrDict[Any]):
@@ -1369,6 +1435,8 @@ class HoltWintersModelSettings(AttrDict[Any]):
     :arg type:
     """
 
+    __slots__ = ()
+
     alpha: Union[float, DefaultType]
     beta: Union[float, DefaultType]
     gamma: Union[float, DefaultType]
@@ -1399,7 +1467,7 @@ class HoltWintersModelSettings(AttrDict[Any]):
             kwargs["period"] = period
         if type is not DEFAULT:
             kwargs["type"] = type
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class InferenceConfigContainer(AttrDict[Any]):
@@ -1408,17 +1476,19 @@ class InferenceConfigContainer(AttrDict[Any]):
     :arg classification: Classification configuration for inference.
     """
 
-    regression: Union["RegressionInferenceOptions", Dict[str, Any], DefaultType]
-    classification: Union["ClassificationInferenceOptions", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    regression: Union[RegressionInferenceOptions, Dict[str, Any], DefaultType]
+    classification: Union[ClassificationInferenceOptions, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         regression: Union[
-            "RegressionInferenceOptions", Dict[str, Any], DefaultType
+            RegressionInferenceOptions, Dict[str, Any], DefaultType
         ] = DEFAULT,
         classification: Union[
-            "ClassificationInferenceOptions", Dict[str, Any], DefaultType
+            ClassificationInferenceOptions, Dict[str, Any], DefaultType
         ] = DEFAULT,
         **kwargs: Any,
     ):
@@ -1426,7 +1496,7 @@ class InferenceConfigContainer(AttrDict[Any]):
             kwargs["regression"] = regression
         if classification is not DEFAULT:
             kwargs["classification"] = classification
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class InnerHits(AttrDict[Any]):
@@ -1453,18 +1523,20 @@ class InnerHits(AttrDict[Any]):
     :arg version:
     """
 
+    __slots__ = ()
+
     name: Union[str, DefaultType]
     size: Union[int, DefaultType]
     from_: Union[int, DefaultType]
-    collapse: Union["FieldCollapse", Dict[str, Any], DefaultType]
+    collapse: Union[FieldCollapse, Dict[str, Any], DefaultType]
     docvalue_fields: Union[
-        Sequence["FieldAndFormat"], Sequence[Dict[str, Any]], DefaultType
+        Sequence[FieldAndFormat], Sequence[Dict[str, Any]], DefaultType
     ]
     explain: Union[bool, DefaultType]
-    highlight: Union["Highlight", Dict[str, Any], DefaultType]
+    highlight: Union[Highlight, Dict[str, Any], DefaultType]
     ignore_unmapped: Union[bool, DefaultType]
     script_fields: Union[
-        Mapping[Union[str, InstrumentedField], "ScriptField"],
+        Mapping[Union[str, InstrumentedField], ScriptField],
         Dict[str, Any],
         DefaultType,
     ]
@@ -1475,12 +1547,12 @@ class InnerHits(AttrDict[Any]):
         DefaultType,
     ]
     sort: Union[
-        Union[Union[str, InstrumentedField], "SortOptions"],
-        Sequence[Union[Union[str, InstrumentedField], "SortOptions"]],
+        Union[Union[str, InstrumentedField], SortOptions],
+        Sequence[Union[Union[str, InstrumentedField], SortOptions]],
         Dict[str, Any],
         DefaultType,
     ]
-    _source: Union[bool, "SourceFilter", Dict[str, Any], DefaultType]
+    _source: Union[bool, SourceFilter, Dict[str, Any], DefaultType]
     stored_fields: Union[
         Union[str, InstrumentedField],
         Sequence[Union[str, InstrumentedField]],
@@ -1495,15 +1567,15 @@ class InnerHits(AttrDict[Any]):
         name: Union[str, DefaultType] = DEFAULT,
         size: Union[int, DefaultType] = DEFAULT,
         from_: Union[int, DefaultType] = DEFAULT,
-        collapse: Union["FieldCollapse", Dict[str, Any], DefaultType] = DEFAULT,
+        collapse: Union[FieldCollapse, Dict[str, Any], DefaultType] = DEFAULT,
         docvalue_fields: Union[
-            Sequence["FieldAndFormat"], Sequence[Dict[str, Any]], DefaultType
+            Sequence[FieldAndFormat], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
         explain: Union[bool, DefaultType] = DEFAULT,
-        highlight: Union["Highlight", Dict[str, Any], DefaultType] = DEFAULT,
+        highlight: Union[Highlight, Dict[str, Any], DefaultType] = DEFAULT,
         ignore_unmapped: Union[bool, DefaultType] = DEFAULT,
         script_fields: Union[
-            Mapping[Union[str, InstrumentedField], "ScriptField"],
+            Mapping[Union[str, InstrumentedField], ScriptField],
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
@@ -1514,12 +1586,12 @@ class InnerHits(AttrDict[Any]):
             DefaultType,
         ] = DEFAULT,
         sort: Union[
-            Union[Union[str, InstrumentedField], "SortOptions"],
-            Sequence[Union[Union[str, InstrumentedField], "SortOptions"]],
+            Union[Union[str, InstrumentedField], SortOptions],
+            Sequence[Union[Union[str, InstrumentedField], SortOptions]],
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
-        _source: Union[bool, "SourceFilter", Dict[str, Any], DefaultType] = DEFAULT,
+        _source: Union[bool, SourceFilter, Dict[str, Any], DefaultType] = DEFAULT,
         stored_fields: Union[
             Union[str, InstrumentedField],
             Sequence[Union[str, InstrumentedField]],
@@ -1546,22 +1618,39 @@ class InnerHits(AttrDict[Any]):
         if ignore_unmapped is not DEFAULT:
             kwargs["ignore_unmapped"] = ignore_unmapped
         if script_fields is not DEFAULT:
-            kwargs["script_fields"] = str(script_fields)
+            kwargs["script_fields"] = {str(k): v for k, v in script_fields.items()}
         if seq_no_primary_term is not DEFAULT:
             kwargs["seq_no_primary_term"] = seq_no_primary_term
         if fields is not DEFAULT:
-            kwargs["fields"] = str(fields)
+            kwargs["fields"] = (
+                str(fields)
+                if isinstance(fields, (str, InstrumentedField))
+                else [str(f) for f in fields]
+            )
         if sort is not DEFAULT:
-            kwargs["sort"] = str(sort)
+            if isinstance(sort, InstrumentedField):
+                kwargs["sort"] = str(sort)
+            elif isinstance(sort, (list, tuple)):
+                # only the field elements are converted, sort options and
+                # dicts are left alone
+                kwargs["sort"] = [
+                    str(s) if isinstance(s, InstrumentedField) else s for s in sort
+                ]
+            else:
+                kwargs["sort"] = sort
         if _source is not DEFAULT:
             kwargs["_source"] = _source
         if stored_fields is not DEFAULT:
-            kwargs["stored_fields"] = str(stored_fields)
+            kwargs["stored_fields"] = (
+                str(stored_fields)
+                if isinstance(stored_fields, (str, InstrumentedField))
+                else [str(f) for f in stored_fields]
+            )
         if track_scores is not DEFAULT:
             kwargs["track_scores"] = track_scores
         if version is not DEFAULT:
             kwargs["version"] = version
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsAllOf(AttrDict[Any]):
@@ -1577,22 +1666,24 @@ class IntervalsAllOf(AttrDict[Any]):
     :arg filter: Rule used to filter returned intervals.
     """
 
+    __slots__ = ()
+
     intervals: Union[
-        Sequence["IntervalsContainer"], Sequence[Dict[str, Any]], DefaultType
+        Sequence[IntervalsContainer], Sequence[Dict[str, Any]], DefaultType
     ]
     max_gaps: Union[int, DefaultType]
     ordered: Union[bool, DefaultType]
-    filter: Union["IntervalsFilter", Dict[str, Any], DefaultType]
+    filter: Union[IntervalsFilter, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         intervals: Union[
-            Sequence["IntervalsContainer"], Sequence[Dict[str, Any]], DefaultType
+            Sequence[IntervalsContainer], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
         max_gaps: Union[int, DefaultType] = DEFAULT,
         ordered: Union[bool, DefaultType] = DEFAULT,
-        filter: Union["IntervalsFilter", Dict[str, Any], DefaultType] = DEFAULT,
+        filter: Union[IntervalsFilter, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if intervals is not DEFAULT:
@@ -1603,7 +1694,7 @@ class IntervalsAllOf(AttrDict[Any]):
             kwargs["ordered"] = ordered
         if filter is not DEFAULT:
             kwargs["filter"] = filter
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsAnyOf(AttrDict[Any]):
@@ -1612,25 +1703,27 @@ class IntervalsAnyOf(AttrDict[Any]):
     :arg filter: Rule used to filter returned intervals.
     """
 
+    __slots__ = ()
+
     intervals: Union[
-        Sequence["IntervalsContainer"], Sequence[Dict[str, Any]], DefaultType
+        Sequence[IntervalsContainer], Sequence[Dict[str, Any]], DefaultType
     ]
-    filter: Union["IntervalsFilter", Dict[str, Any], DefaultType]
+    filter: Union[IntervalsFilter, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         intervals: Union[
-            Sequence["IntervalsContainer"], Sequence[Dict[str, Any]], DefaultType
+            Sequence[IntervalsContainer], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
-        filter: Union["IntervalsFilter", Dict[str, Any], DefaultType] = DEFAULT,
+        filter: Union[IntervalsFilter, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if intervals is not DEFAULT:
             kwargs["intervals"] = intervals
         if filter is not DEFAULT:
             kwargs["filter"] = filter
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsContainer(AttrDict[Any]):
@@ -1644,22 +1737,24 @@ class IntervalsContainer(AttrDict[Any]):
     :arg wildcard: Matches terms using a wildcard pattern.
     """
 
-    all_of: Union["IntervalsAllOf", Dict[str, Any], DefaultType]
-    any_of: Union["IntervalsAnyOf", Dict[str, Any], DefaultType]
-    fuzzy: Union["IntervalsFuzzy", Dict[str, Any], DefaultType]
-    match: Union["IntervalsMatch", Dict[str, Any], DefaultType]
-    prefix: Union["IntervalsPrefix", Dict[str, Any], DefaultType]
-    wildcard: Union["IntervalsWildcard", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    all_of: Union[IntervalsAllOf, Dict[str, Any], DefaultType]
+    any_of: Union[IntervalsAnyOf, Dict[str, Any], DefaultType]
+    fuzzy: Union[IntervalsFuzzy, Dict[str, Any], DefaultType]
+    match: Union[IntervalsMatch, Dict[str, Any], DefaultType]
+    prefix: Union[IntervalsPrefix, Dict[str, Any], DefaultType]
+    wildcard: Union[IntervalsWildcard, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
-        all_of: Union["IntervalsAllOf", Dict[str, Any], DefaultType] = DEFAULT,
-        any_of: Union["IntervalsAnyOf", Dict[str, Any], DefaultType] = DEFAULT,
-        fuzzy: Union["IntervalsFuzzy", Dict[str, Any], DefaultType] = DEFAULT,
-        match: Union["IntervalsMatch", Dict[str, Any], DefaultType] = DEFAULT,
-        prefix: Union["IntervalsPrefix", Dict[str, Any], DefaultType] = DEFAULT,
-        wildcard: Union["IntervalsWildcard", Dict[str, Any], DefaultType] = DEFAULT,
+        all_of: Union[IntervalsAllOf, Dict[str, Any], DefaultType] = DEFAULT,
+        any_of: Union[IntervalsAnyOf, Dict[str, Any], DefaultType] = DEFAULT,
+        fuzzy: Union[IntervalsFuzzy, Dict[str, Any], DefaultType] = DEFAULT,
+        match: Union[IntervalsMatch, Dict[str, Any], DefaultType] = DEFAULT,
+        prefix: Union[IntervalsPrefix, Dict[str, Any], DefaultType] = DEFAULT,
+        wildcard: Union[IntervalsWildcard, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if all_of is not DEFAULT:
@@ -1674,7 +1769,7 @@ class IntervalsContainer(AttrDict[Any]):
             kwargs["prefix"] = prefix
         if wildcard is not DEFAULT:
             kwargs["wildcard"] = wildcard
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsFilter(AttrDict[Any]):
@@ -1699,36 +1794,36 @@ class IntervalsFilter(AttrDict[Any]):
         must return a boolean value: `true` or `false`.
     """
 
-    after: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    before: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    contained_by: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    containing: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    not_contained_by: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    not_containing: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    not_overlapping: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    overlapping: Union["IntervalsContainer", Dict[str, Any], DefaultType]
-    script: Union["Script", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    after: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    before: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    contained_by: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    containing: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    not_contained_by: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    not_containing: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    not_overlapping: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    overlapping: Union[IntervalsContainer, Dict[str, Any], DefaultType]
+    script: Union[Script, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
-        after: Union["IntervalsContainer", Dict[str, Any], DefaultType] = DEFAULT,
-        before: Union["IntervalsContainer", Dict[str, Any], DefaultType] = DEFAULT,
-        contained_by: Union[
-            "IntervalsContainer", Dict[str, Any], DefaultType
-        ] = DEFAULT,
-        containing: Union["IntervalsContainer", Dict[str, Any], DefaultType] = DEFAULT,
+        after: Union[IntervalsContainer, Dict[str, Any], DefaultType] = DEFAULT,
+        before: Union[IntervalsContainer, Dict[str, Any], DefaultType] = DEFAULT,
+        contained_by: Union[IntervalsContainer, Dict[str, Any], DefaultType] = DEFAULT,
+        containing: Union[IntervalsContainer, Dict[str, Any], DefaultType] = DEFAULT,
         not_contained_by: Union[
-            "IntervalsContainer", Dict[str, Any], DefaultType
+            IntervalsContainer, Dict[str, Any], DefaultType
         ] = DEFAULT,
         not_containing: Union[
-            "IntervalsContainer", Dict[str, Any], DefaultType
+            IntervalsContainer, Dict[str, Any], DefaultType
         ] = DEFAULT,
         not_overlapping: Union[
-            "IntervalsContainer", Dict[str, Any], DefaultType
+            IntervalsContainer, Dict[str, Any], DefaultType
         ] = DEFAULT,
-        overlapping: Union["IntervalsContainer", Dict[str, Any], DefaultType] = DEFAULT,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        overlapping: Union[IntervalsContainer, Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if after is not DEFAULT:
@@ -1749,7 +1844,7 @@ class IntervalsFilter(AttrDict[Any]):
             kwargs["overlapping"] = overlapping
         if script is not DEFAULT:
             kwargs["script"] = script
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsFuzzy(AttrDict[Any]):
@@ -1769,6 +1864,8 @@ class IntervalsFuzzy(AttrDict[Any]):
         separately.
     """
 
+    __slots__ = ()
+
     term: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     fuzziness: Union[str, int, DefaultType]
@@ -1799,7 +1896,7 @@ class IntervalsFuzzy(AttrDict[Any]):
             kwargs["transpositions"] = transpositions
         if use_field is not DEFAULT:
             kwargs["use_field"] = str(use_field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsMatch(AttrDict[Any]):
@@ -1818,12 +1915,14 @@ class IntervalsMatch(AttrDict[Any]):
     :arg filter: An optional interval filter.
     """
 
+    __slots__ = ()
+
     query: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     max_gaps: Union[int, DefaultType]
     ordered: Union[bool, DefaultType]
     use_field: Union[str, InstrumentedField, DefaultType]
-    filter: Union["IntervalsFilter", Dict[str, Any], DefaultType]
+    filter: Union[IntervalsFilter, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
@@ -1833,7 +1932,7 @@ class IntervalsMatch(AttrDict[Any]):
         max_gaps: Union[int, DefaultType] = DEFAULT,
         ordered: Union[bool, DefaultType] = DEFAULT,
         use_field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
-        filter: Union["IntervalsFilter", Dict[str, Any], DefaultType] = DEFAULT,
+        filter: Union[IntervalsFilter, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if query is not DEFAULT:
@@ -1848,7 +1947,7 @@ class IntervalsMatch(AttrDict[Any]):
             kwargs["use_field"] = str(use_field)
         if filter is not DEFAULT:
             kwargs["filter"] = filter
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsPrefix(AttrDict[Any]):
@@ -1862,6 +1961,8 @@ class IntervalsPrefix(AttrDict[Any]):
         separately.
     """
 
+    __slots__ = ()
+
     prefix: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     use_field: Union[str, InstrumentedField, DefaultType]
@@ -1880,7 +1981,7 @@ class IntervalsPrefix(AttrDict[Any]):
             kwargs["analyzer"] = analyzer
         if use_field is not DEFAULT:
             kwargs["use_field"] = str(use_field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsQuery(AttrDict[Any]):
@@ -1901,24 +2002,26 @@ class IntervalsQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    all_of: Union["IntervalsAllOf", Dict[str, Any], DefaultType]
-    any_of: Union["IntervalsAnyOf", Dict[str, Any], DefaultType]
-    fuzzy: Union["IntervalsFuzzy", Dict[str, Any], DefaultType]
-    match: Union["IntervalsMatch", Dict[str, Any], DefaultType]
-    prefix: Union["IntervalsPrefix", Dict[str, Any], DefaultType]
-    wildcard: Union["IntervalsWildcard", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    all_of: Union[IntervalsAllOf, Dict[str, Any], DefaultType]
+    any_of: Union[IntervalsAnyOf, Dict[str, Any], DefaultType]
+    fuzzy: Union[IntervalsFuzzy, Dict[str, Any], DefaultType]
+    match: Union[IntervalsMatch, Dict[str, Any], DefaultType]
+    prefix: Union[IntervalsPrefix, Dict[str, Any], DefaultType]
+    wildcard: Union[IntervalsWildcard, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
     def __init__(
         self,
         *,
-        all_of: Union["IntervalsAllOf", Dict[str, Any], DefaultType] = DEFAULT,
-        any_of: Union["IntervalsAnyOf", Dict[str, Any], DefaultType] = DEFAULT,
-        fuzzy: Union["IntervalsFuzzy", Dict[str, Any], DefaultType] = DEFAULT,
-        match: Union["IntervalsMatch", Dict[str, Any], DefaultType] = DEFAULT,
-        prefix: Union["IntervalsPrefix", Dict[str, Any], DefaultType] = DEFAULT,
-        wildcard: Union["IntervalsWildcard", Dict[str, Any], DefaultType] = DEFAULT,
+        all_of: Union[IntervalsAllOf, Dict[str, Any], DefaultType] = DEFAULT,
+        any_of: Union[IntervalsAnyOf, Dict[str, Any], DefaultType] = DEFAULT,
+        fuzzy: Union[IntervalsFuzzy, Dict[str, Any], DefaultType] = DEFAULT,
+        match: Union[IntervalsMatch, Dict[str, Any], DefaultType] = DEFAULT,
+        prefix: Union[IntervalsPrefix, Dict[str, Any], DefaultType] = DEFAULT,
+        wildcard: Union[IntervalsWildcard, Dict[str, Any], DefaultType] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
         **kwargs: Any,
@@ -1939,7 +2042,7 @@ class IntervalsQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IntervalsWildcard(AttrDict[Any]):
@@ -1953,6 +2056,8 @@ class IntervalsWildcard(AttrDict[Any]):
         separately.
     """
 
+    __slots__ = ()
+
     pattern: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     use_field: Union[str, InstrumentedField, DefaultType]
@@ -1971,7 +2076,7 @@ class IntervalsWildcard(AttrDict[Any]):
             kwargs["analyzer"] = analyzer
         if use_field is not DEFAULT:
             kwargs["use_field"] = str(use_field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class IpRangeAggregationRange(AttrDict[Any]):
@@ -1981,6 +2086,8 @@ class IpRangeAggregationRange(AttrDict[Any]):
     :arg to: End of the range.
     """
 
+    __slots__ = ()
+
     from_: Union[str, None, DefaultType]
     mask: Union[str, DefaultType]
     to: Union[str, None, DefaultType]
@@ -1999,7 +2106,7 @@ class IpRangeAggregationRange(AttrDict[Any]):
             kwargs["mask"] = mask
         if to is not DEFAULT:
             kwargs["to"] = to
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class LatLonGeoLocation(AttrDict[Any]):
@@ -2008,6 +2115,8 @@ class LatLonGeoLocation(AttrDict[Any]):
     :arg lon: (required) Longitude
     """
 
+    __slots__ = ()
+
     lat: Union[float, DefaultType]
     lon: Union[float, DefaultType]
 
@@ -2022,7 +2131,7 @@ class LatLonGeoLocation(AttrDict[Any]):
             kwargs["lat"] = lat
         if lon is not DEFAULT:
             kwargs["lon"] = lon
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class LikeDocument(AttrDict[Any]):
@@ -2037,6 +2146,8 @@ class LikeDocument(AttrDict[Any]):
     :arg version_type:  Defaults to `'internal'` if omitted.
     """
 
+    __slots__ = ()
+
     doc: Any
     fields: Union[Sequence[Union[str, InstrumentedField]], DefaultType]
     _id: Union[str, DefaultType]
@@ -2068,20 +2179,26 @@ class LikeDocument(AttrDict[Any]):
         if doc is not DEFAULT:
             kwargs["doc"] = doc
         if fields is not DEFAULT:
-            kwargs["fields"] = str(fields)
+            kwargs["fields"] = (
+                str(fields)
+                if isinstance(fields, (str, InstrumentedField))
+                else [str(f) for f in fields]
+            )
         if _id is not DEFAULT:
             kwargs["_id"] = _id
         if _index is not DEFAULT:
             kwargs["_index"] = _index
         if per_field_analyzer is not DEFAULT:
-            kwargs["per_field_analyzer"] = str(per_field_analyzer)
+            kwargs["per_field_analyzer"] = {
+                str(k): v for k, v in per_field_analyzer.items()
+            }
         if routing is not DEFAULT:
             kwargs["routing"] = routing
         if version is not DEFAULT:
             kwargs["version"] = version
         if version_type is not DEFAULT:
             kwargs["version_type"] = version_type
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MatchBoolPrefixQuery(AttrDict[Any]):
@@ -2120,6 +2237,8 @@ class MatchBoolPrefixQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     query: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     fuzziness: Union[str, int, DefaultType]
@@ -2170,7 +2289,7 @@ class MatchBoolPrefixQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MatchPhrasePrefixQuery(AttrDict[Any]):
@@ -2194,6 +2313,8 @@ class MatchPhrasePrefixQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     query: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     max_expansions: Union[int, DefaultType]
@@ -2228,7 +2349,7 @@ class MatchPhrasePrefixQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MatchPhraseQuery(AttrDict[Any]):
@@ -2250,6 +2371,8 @@ class MatchPhraseQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     query: Union[str, DefaultType]
     analyzer: Union[str, DefaultType]
     slop: Union[int, DefaultType]
@@ -2280,7 +2403,7 @@ class MatchPhraseQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MatchQuery(AttrDict[Any]):
@@ -2319,6 +2442,8 @@ class MatchQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     query: Union[str, float, bool, DefaultType]
     analyzer: Union[str, DefaultType]
     auto_generate_synonyms_phrase_query: Union[bool, DefaultType]
@@ -2387,7 +2512,7 @@ class MatchQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MultiTermLookup(AttrDict[Any]):
@@ -2397,6 +2522,8 @@ class MultiTermLookup(AttrDict[Any]):
         value. By default, documents without a value are ignored.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
     missing: Union[str, int, float, bool, DefaultType]
 
@@ -2411,7 +2538,7 @@ class MultiTermLookup(AttrDict[Any]):
             kwargs["field"] = str(field)
         if missing is not DEFAULT:
             kwargs["missing"] = missing
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class MutualInformationHeuristic(AttrDict[Any]):
@@ -2424,6 +2551,8 @@ class MutualInformationHeuristic(AttrDict[Any]):
         subset.
     """
 
+    __slots__ = ()
+
     background_is_superset: Union[bool, DefaultType]
     include_negatives: Union[bool, DefaultType]
 
@@ -2438,7 +2567,7 @@ class MutualInformationHeuristic(AttrDict[Any]):
             kwargs["background_is_superset"] = background_is_superset
         if include_negatives is not DEFAULT:
             kwargs["include_negatives"] = include_negatives
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class NestedSortValue(AttrDict[Any]):
@@ -2449,10 +2578,12 @@ class NestedSortValue(AttrDict[Any]):
     :arg nested:
     """
 
+    __slots__ = ()
+
     path: Union[str, InstrumentedField, DefaultType]
     filter: Union[Query, DefaultType]
     max_children: Union[int, DefaultType]
-    nested: Union["NestedSortValue", Dict[str, Any], DefaultType]
+    nested: Union[NestedSortValue, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
@@ -2460,7 +2591,7 @@ class NestedSortValue(AttrDict[Any]):
         path: Union[str, InstrumentedField, DefaultType] = DEFAULT,
         filter: Union[Query, DefaultType] = DEFAULT,
         max_children: Union[int, DefaultType] = DEFAULT,
-        nested: Union["NestedSortValue", Dict[str, Any], DefaultType] = DEFAULT,
+        nested: Union[NestedSortValue, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if path is not DEFAULT:
@@ -2471,11 +2602,17 @@ class NestedSortValue(AttrDict[Any]):
             kwargs["max_children"] = max_children
         if nested is not DEFAULT:
             kwargs["nested"] = nested
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class PercentageScoreHeuristic(AttrDict[Any]):
-    pass
+    __slots__ = ()
+
+    def __init__(self, d: Union[Dict[str, Any], None] = None, **kwargs: Any):
+        # a dict passed positionally is used as the payload, like AttrDict does
+        if d is not None:
+            kwargs = {**d, **kwargs} if kwargs else d
+        _attrdict_init(self, kwargs)
 
 
 class PinnedDoc(AttrDict[Any]):
@@ -2484,6 +2621,8 @@ class PinnedDoc(AttrDict[Any]):
     :arg _index: (required) The index that contains the document.
     """
 
+    __slots__ = ()
+
     _id: Union[str, DefaultType]
     _index: Union[str, DefaultType]
 
@@ -2498,7 +2637,7 @@ class PinnedDoc(AttrDict[Any]):
             kwargs["_id"] = _id
         if _index is not DEFAULT:
             kwargs["_index"] = _index
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class PrefixQuery(AttrDict[Any]):
@@ -2518,6 +2657,8 @@ class PrefixQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     value: Union[str, DefaultType]
     rewrite: Union[str, DefaultType]
     case_insensitive: Union[bool, DefaultType]
@@ -2544,7 +2685,7 @@ class PrefixQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class QueryVectorBuilder(AttrDict[Any]):
@@ -2552,21 +2693,29 @@ class QueryVectorBuilder(AttrDict[Any]):
     :arg text_embedding:
     """
 
-    text_embedding: Union["TextEmbedding", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    text_embedding: Union[TextEmbedding, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
-        text_embedding: Union["TextEmbedding", Dict[str, Any], DefaultType] = DEFAULT,
+        text_embedding: Union[TextEmbedding, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if text_embedding is not DEFAULT:
             kwargs["text_embedding"] = text_embedding
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class RankFeatureFunctionLinear(AttrDict[Any]):
-    pass
+    __slots__ = ()
+
+    def __init__(self, d: Union[Dict[str, Any], None] = None, **kwargs: Any):
+        # a dict passed positionally is used as the payload, like AttrDict does
+        if d is not None:
+            kwargs = {**d, **kwargs} if kwargs else d
+        _attrdict_init(self, kwargs)
 
 
 class RankFeatureFunctionLogarithm(AttrDict[Any]):
@@ -2574,6 +2723,8 @@ class RankFeatureFunctionLogarithm(AttrDict[Any]):
     :arg scaling_factor: (required) Configurable scaling factor.
     """
 
+    __slots__ = ()
+
     scaling_factor: Union[float, DefaultType]
 
     def __init__(
@@ -2581,7 +2732,7 @@ class RankFeatureFunctionLogarithm(AttrDict[Any]):
     ):
         if scaling_factor is not DEFAULT:
             kwargs["scaling_factor"] = scaling_factor
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class RankFeatureFunctionSaturation(AttrDict[Any]):
@@ -2590,12 +2741,14 @@ class RankFeatureFunctionSaturation(AttrDict[Any]):
         than 0.5.
     """
 
+    __slots__ = ()
+
     pivot: Union[float, DefaultType]
 
     def __init__(self, *, pivot: Union[float, DefaultType] = DEFAULT, **kwargs: Any):
         if pivot is not DEFAULT:
             kwargs["pivot"] = pivot
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class RankFeatureFunctionSigmoid(AttrDict[Any]):
@@ -2605,6 +2758,8 @@ class RankFeatureFunctionSigmoid(AttrDict[Any]):
     :arg exponent: (required) Configurable Exponent.
     """
 
+    __slots__ = ()
+
     pivot: Union[float, DefaultType]
     exponent: Union[float, DefaultType]
 
@@ -2619,7 +2774,7 @@ class RankFeatureFunctionSigmoid(AttrDict[Any]):
             kwargs["pivot"] = pivot
         if exponent is not DEFAULT:
             kwargs["exponent"] = exponent
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class RegexpQuery(AttrDict[Any]):
@@ -2642,6 +2797,8 @@ class RegexpQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     value: Union[str, DefaultType]
     case_insensitive: Union[bool, DefaultType]
     flags: Union[str, DefaultType]
@@ -2676,7 +2833,7 @@ class RegexpQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class RegressionInferenceOptions(AttrDict[Any]):
@@ -2687,6 +2844,8 @@ class RegressionInferenceOptions(AttrDict[Any]):
         of feature importance values per document.
     """
 
+    __slots__ = ()
+
     results_field: Union[str, InstrumentedField, DefaultType]
     num_top_feature_importance_values: Union[int, DefaultType]
 
@@ -2703,7 +2862,7 @@ class RegressionInferenceOptions(AttrDict[Any]):
             kwargs["num_top_feature_importance_values"] = (
                 num_top_feature_importance_values
             )
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ScoreSort(AttrDict[Any]):
@@ -2711,6 +2870,8 @@ class ScoreSort(AttrDict[Any]):
     :arg order:
     """
 
+    __slots__ = ()
+
     order: Union[Literal["asc", "desc"], DefaultType]
 
     def __init__(
@@ -2721,7 +2882,7 @@ class ScoreSort(AttrDict[Any]):
     ):
         if order is not DEFAULT:
             kwargs["order"] = order
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class Script(AttrDict[Any]):
@@ -2736,6 +2897,8 @@ class Script(AttrDict[Any]):
     :arg options:
     """
 
+    __slots__ = ()
+
     source: Union[str, DefaultType]
     id: Union[str, DefaultType]
     params: Union[Mapping[str, Any], DefaultType]
@@ -2764,7 +2927,7 @@ class Script(AttrDict[Any]):
             kwargs["lang"] = lang
         if options is not DEFAULT:
             kwargs["options"] = options
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ScriptField(AttrDict[Any]):
@@ -2773,13 +2936,15 @@ class ScriptField(AttrDict[Any]):
     :arg ignore_failure:
     """
 
-    script: Union["Script", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    script: Union[Script, Dict[str, Any], DefaultType]
     ignore_failure: Union[bool, DefaultType]
 
     def __init__(
         self,
         *,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         ignore_failure: Union[bool, DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
@@ -2787,7 +2952,7 @@ class ScriptField(AttrDict[Any]):
             kwargs["script"] = script
         if ignore_failure is not DEFAULT:
             kwargs["ignore_failure"] = ignore_failure
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ScriptSort(AttrDict[Any]):
@@ -2799,22 +2964,24 @@ class ScriptSort(AttrDict[Any]):
     :arg nested:
     """
 
-    script: Union["Script", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    script: Union[Script, Dict[str, Any], DefaultType]
     order: Union[Literal["asc", "desc"], DefaultType]
     type: Union[Literal["string", "number", "version"], DefaultType]
     mode: Union[Literal["min", "max", "sum", "avg", "median"], DefaultType]
-    nested: Union["NestedSortValue", Dict[str, Any], DefaultType]
+    nested: Union[NestedSortValue, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         order: Union[Literal["asc", "desc"], DefaultType] = DEFAULT,
         type: Union[Literal["string", "number", "version"], DefaultType] = DEFAULT,
         mode: Union[
             Literal["min", "max", "sum", "avg", "median"], DefaultType
         ] = DEFAULT,
-        nested: Union["NestedSortValue", Dict[str, Any], DefaultType] = DEFAULT,
+        nested: Union[NestedSortValue, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if script is not DEFAULT:
@@ -2827,7 +2994,7 @@ class ScriptSort(AttrDict[Any]):
             kwargs["mode"] = mode
         if nested is not DEFAULT:
             kwargs["nested"] = nested
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ScriptedHeuristic(AttrDict[Any]):
@@ -2835,17 +3002,19 @@ class ScriptedHeuristic(AttrDict[Any]):
     :arg script: (required)
     """
 
-    script: Union["Script", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    script: Union[Script, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if script is not DEFAULT:
             kwargs["script"] = script
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class ShapeFieldQuery(AttrDict[Any]):
@@ -2857,7 +3026,9 @@ class ShapeFieldQuery(AttrDict[Any]):
         Well Known Text (WKT) format.
     """
 
-    indexed_shape: Union["FieldLookup", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    indexed_shape: Union[FieldLookup, Dict[str, Any], DefaultType]
     relation: Union[
         Literal["intersects", "disjoint", "within", "contains"], DefaultType
     ]
@@ -2866,7 +3037,7 @@ class ShapeFieldQuery(AttrDict[Any]):
     def __init__(
         self,
         *,
-        indexed_shape: Union["FieldLookup", Dict[str, Any], DefaultType] = DEFAULT,
+        indexed_shape: Union[FieldLookup, Dict[str, Any], DefaultType] = DEFAULT,
         relation: Union[
             Literal["intersects", "disjoint", "within", "contains"], DefaultType
         ] = DEFAULT,
@@ -2879,7 +3050,7 @@ class ShapeFieldQuery(AttrDict[Any]):
             kwargs["relation"] = relation
         if shape is not DEFAULT:
             kwargs["shape"] = shape
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SortOptions(AttrDict[Any]):
@@ -2892,22 +3063,24 @@ class SortOptions(AttrDict[Any]):
     :arg _script:
     """
 
-    _field: Union[str, "InstrumentedField", "DefaultType"]
-    _value: Union["FieldSort", Dict[str, Any], "DefaultType"]
-    _score: Union["ScoreSort", Dict[str, Any], DefaultType]
-    _doc: Union["ScoreSort", Dict[str, Any], DefaultType]
-    _geo_distance: Union["GeoDistanceSort", Dict[str, Any], DefaultType]
-    _script: Union["ScriptSort", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    _field: Union[str, InstrumentedField, DefaultType]
+    _value: Union[FieldSort, Dict[str, Any], DefaultType]
+    _score: Union[ScoreSort, Dict[str, Any], DefaultType]
+    _doc: Union[ScoreSort, Dict[str, Any], DefaultType]
+    _geo_distance: Union[GeoDistanceSort, Dict[str, Any], DefaultType]
+    _script: Union[ScriptSort, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
-        _field: Union[str, "InstrumentedField", "DefaultType"] = DEFAULT,
-        _value: Union["FieldSort", Dict[str, Any], "DefaultType"] = DEFAULT,
+        _field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
+        _value: Union[FieldSort, Dict[str, Any], DefaultType] = DEFAULT,
         *,
-        _score: Union["ScoreSort", Dict[str, Any], DefaultType] = DEFAULT,
-        _doc: Union["ScoreSort", Dict[str, Any], DefaultType] = DEFAULT,
-        _geo_distance: Union["GeoDistanceSort", Dict[str, Any], DefaultType] = DEFAULT,
-        _script: Union["ScriptSort", Dict[str, Any], DefaultType] = DEFAULT,
+        _score: Union[ScoreSort, Dict[str, Any], DefaultType] = DEFAULT,
+        _doc: Union[ScoreSort, Dict[str, Any], DefaultType] = DEFAULT,
+        _geo_distance: Union[GeoDistanceSort, Dict[str, Any], DefaultType] = DEFAULT,
+        _script: Union[ScriptSort, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if _field is not DEFAULT:
@@ -2920,7 +3093,7 @@ class SortOptions(AttrDict[Any]):
             kwargs["_geo_distance"] = _geo_distance
         if _script is not DEFAULT:
             kwargs["_script"] = _script
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SourceFilter(AttrDict[Any]):
@@ -2929,6 +3102,8 @@ class SourceFilter(AttrDict[Any]):
     :arg includes:
     """
 
+    __slots__ = ()
+
     excludes: Union[
         Union[str, InstrumentedField],
         Sequence[Union[str, InstrumentedField]],
@@ -2956,10 +3131,18 @@ class SourceFilter(AttrDict[Any]):
         **kwargs: Any,
     ):
         if excludes is not DEFAULT:
-            kwargs["excludes"] = str(excludes)
+            kwargs["excludes"] = (
+                str(excludes)
+                if isinstance(excludes, (str, InstrumentedField))
+                else [str(f) for f in excludes]
+            )
         if includes is not DEFAULT:
-            kwargs["includes"] = str(includes)
-        super().__init__(kwargs)
+            kwargs["includes"] = (
+                str(includes)
+                if isinstance(includes, (str, InstrumentedField))
+                else [str(f) for f in includes]
+            )
+        _attrdict_init(self, kwargs)
 
 
 class SpanContainingQuery(AttrDict[Any]):
@@ -2976,16 +3159,18 @@ class SpanContainingQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    big: Union["SpanQuery", Dict[str, Any], DefaultType]
-    little: Union["SpanQuery", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    big: Union[SpanQuery, Dict[str, Any], DefaultType]
+    little: Union[SpanQuery, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
     def __init__(
         self,
         *,
-        big: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        little: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        big: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        little: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
         **kwargs: Any,
@@ -2998,7 +3183,7 @@ class SpanContainingQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanFieldMaskingQuery(AttrDict[Any]):
@@ -3013,8 +3198,10 @@ class SpanFieldMaskingQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
-    query: Union["SpanQuery", Dict[str, Any], DefaultType]
+    query: Union[SpanQuery, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3022,7 +3209,7 @@ class SpanFieldMaskingQuery(AttrDict[Any]):
         self,
         *,
         field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
-        query: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        query: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
         **kwargs: Any,
@@ -3035,7 +3222,7 @@ class SpanFieldMaskingQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanFirstQuery(AttrDict[Any]):
@@ -3051,8 +3238,10 @@ class SpanFirstQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     end: Union[int, DefaultType]
-    match: Union["SpanQuery", Dict[str, Any], DefaultType]
+    match: Union[SpanQuery, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3060,7 +3249,7 @@ class SpanFirstQuery(AttrDict[Any]):
         self,
         *,
         end: Union[int, DefaultType] = DEFAULT,
-        match: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        match: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
         **kwargs: Any,
@@ -3073,7 +3262,7 @@ class SpanFirstQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanMultiTermQuery(AttrDict[Any]):
@@ -3088,6 +3277,8 @@ class SpanMultiTermQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     match: Union[Query, DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
@@ -3106,7 +3297,7 @@ class SpanMultiTermQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanNearQuery(AttrDict[Any]):
@@ -3123,7 +3314,9 @@ class SpanNearQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    clauses: Union[Sequence["SpanQuery"], Sequence[Dict[str, Any]], DefaultType]
+    __slots__ = ()
+
+    clauses: Union[Sequence[SpanQuery], Sequence[Dict[str, Any]], DefaultType]
     in_order: Union[bool, DefaultType]
     slop: Union[int, DefaultType]
     boost: Union[float, DefaultType]
@@ -3133,7 +3326,7 @@ class SpanNearQuery(AttrDict[Any]):
         self,
         *,
         clauses: Union[
-            Sequence["SpanQuery"], Sequence[Dict[str, Any]], DefaultType
+            Sequence[SpanQuery], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
         in_order: Union[bool, DefaultType] = DEFAULT,
         slop: Union[int, DefaultType] = DEFAULT,
@@ -3151,7 +3344,7 @@ class SpanNearQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanNotQuery(AttrDict[Any]):
@@ -3174,8 +3367,10 @@ class SpanNotQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    exclude: Union["SpanQuery", Dict[str, Any], DefaultType]
-    include: Union["SpanQuery", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    exclude: Union[SpanQuery, Dict[str, Any], DefaultType]
+    include: Union[SpanQuery, Dict[str, Any], DefaultType]
     dist: Union[int, DefaultType]
     post: Union[int, DefaultType]
     pre: Union[int, DefaultType]
@@ -3185,8 +3380,8 @@ class SpanNotQuery(AttrDict[Any]):
     def __init__(
         self,
         *,
-        exclude: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        include: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        exclude: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        include: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
         dist: Union[int, DefaultType] = DEFAULT,
         post: Union[int, DefaultType] = DEFAULT,
         pre: Union[int, DefaultType] = DEFAULT,
@@ -3208,7 +3403,7 @@ class SpanNotQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanOrQuery(AttrDict[Any]):
@@ -3222,7 +3417,9 @@ class SpanOrQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    clauses: Union[Sequence["SpanQuery"], Sequence[Dict[str, Any]], DefaultType]
+    __slots__ = ()
+
+    clauses: Union[Sequence[SpanQuery], Sequence[Dict[str, Any]], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3230,7 +3427,7 @@ class SpanOrQuery(AttrDict[Any]):
         self,
         *,
         clauses: Union[
-            Sequence["SpanQuery"], Sequence[Dict[str, Any]], DefaultType
+            Sequence[SpanQuery], Sequence[Dict[str, Any]], DefaultType
         ] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
@@ -3242,7 +3439,7 @@ class SpanOrQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanQuery(AttrDict[Any]):
@@ -3270,44 +3467,46 @@ class SpanQuery(AttrDict[Any]):
         other span queries.
     """
 
-    span_containing: Union["SpanContainingQuery", Dict[str, Any], DefaultType]
-    span_field_masking: Union["SpanFieldMaskingQuery", Dict[str, Any], DefaultType]
-    span_first: Union["SpanFirstQuery", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    span_containing: Union[SpanContainingQuery, Dict[str, Any], DefaultType]
+    span_field_masking: Union[SpanFieldMaskingQuery, Dict[str, Any], DefaultType]
+    span_first: Union[SpanFirstQuery, Dict[str, Any], DefaultType]
     span_gap: Union[Mapping[Union[str, InstrumentedField], int], DefaultType]
-    span_multi: Union["SpanMultiTermQuery", Dict[str, Any], DefaultType]
-    span_near: Union["SpanNearQuery", Dict[str, Any], DefaultType]
-    span_not: Union["SpanNotQuery", Dict[str, Any], DefaultType]
-    span_or: Union["SpanOrQuery", Dict[str, Any], DefaultType]
+    span_multi: Union[SpanMultiTermQuery, Dict[str, Any], DefaultType]
+    span_near: Union[SpanNearQuery, Dict[str, Any], DefaultType]
+    span_not: Union[SpanNotQuery, Dict[str, Any], DefaultType]
+    span_or: Union[SpanOrQuery, Dict[str, Any], DefaultType]
     span_term: Union[
-        Mapping[Union[str, InstrumentedField], "SpanTermQuery"],
+        Mapping[Union[str, InstrumentedField], SpanTermQuery],
         Dict[str, Any],
         DefaultType,
     ]
-    span_within: Union["SpanWithinQuery", Dict[str, Any], DefaultType]
+    span_within: Union[SpanWithinQuery, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         span_containing: Union[
-            "SpanContainingQuery", Dict[str, Any], DefaultType
+            SpanContainingQuery, Dict[str, Any], DefaultType
         ] = DEFAULT,
         span_field_masking: Union[
-            "SpanFieldMaskingQuery", Dict[str, Any], DefaultType
+            SpanFieldMaskingQuery, Dict[str, Any], DefaultType
         ] = DEFAULT,
-        span_first: Union["SpanFirstQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        span_first: Union[SpanFirstQuery, Dict[str, Any], DefaultType] = DEFAULT,
         span_gap: Union[
             Mapping[Union[str, InstrumentedField], int], DefaultType
         ] = DEFAULT,
-        span_multi: Union["SpanMultiTermQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        span_near: Union["SpanNearQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        span_not: Union["SpanNotQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        span_or: Union["SpanOrQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        span_multi: Union[SpanMultiTermQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        span_near: Union[SpanNearQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        span_not: Union[SpanNotQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        span_or: Union[SpanOrQuery, Dict[str, Any], DefaultType] = DEFAULT,
         span_term: Union[
-            Mapping[Union[str, InstrumentedField], "SpanTermQuery"],
+            Mapping[Union[str, InstrumentedField], SpanTermQuery],
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
-        span_within: Union["SpanWithinQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        span_within: Union[SpanWithinQuery, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if span_containing is not DEFAULT:
@@ -3317,7 +3516,7 @@ class SpanQuery(AttrDict[Any]):
         if span_first is not DEFAULT:
             kwargs["span_first"] = span_first
         if span_gap is not DEFAULT:
-            kwargs["span_gap"] = str(span_gap)
+            kwargs["span_gap"] = {str(k): v for k, v in span_gap.items()}
         if span_multi is not DEFAULT:
             kwargs["span_multi"] = span_multi
         if span_near is not DEFAULT:
@@ -3327,10 +3526,10 @@ class SpanQuery(AttrDict[Any]):
         if span_or is not DEFAULT:
             kwargs["span_or"] = span_or
         if span_term is not DEFAULT:
-            kwargs["span_term"] = str(span_term)
+            kwargs["span_term"] = {str(k): v for k, v in span_term.items()}
         if span_within is not DEFAULT:
             kwargs["span_within"] = span_within
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanTermQuery(AttrDict[Any]):
@@ -3344,6 +3543,8 @@ class SpanTermQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     value: Union[str, DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
@@ -3362,7 +3563,7 @@ class SpanTermQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class SpanWithinQuery(AttrDict[Any]):
@@ -3379,16 +3580,18 @@ class SpanWithinQuery(AttrDict[Any]):
     :arg _name:
     """
 
-    big: Union["SpanQuery", Dict[str, Any], DefaultType]
-    little: Union["SpanQuery", Dict[str, Any], DefaultType]
+    __slots__ = ()
+
+    big: Union[SpanQuery, Dict[str, Any], DefaultType]
+    little: Union[SpanQuery, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
     def __init__(
         self,
         *,
-        big: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
-        little: Union["SpanQuery", Dict[str, Any], DefaultType] = DEFAULT,
+        big: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
+        little: Union[SpanQuery, Dict[str, Any], DefaultType] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
         **kwargs: Any,
@@ -3401,7 +3604,7 @@ class SpanWithinQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TDigest(AttrDict[Any]):
@@ -3411,6 +3614,8 @@ class TDigest(AttrDict[Any]):
         control of memory usage and approximation error.
     """
 
+    __slots__ = ()
+
     compression: Union[int, DefaultType]
 
     def __init__(
@@ -3418,7 +3623,7 @@ class TDigest(AttrDict[Any]):
     ):
         if compression is not DEFAULT:
             kwargs["compression"] = compression
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TermQuery(AttrDict[Any]):
@@ -3436,6 +3641,8 @@ class TermQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     value: Union[int, float, str, bool, None, Any, DefaultType]
     case_insensitive: Union[bool, DefaultType]
     boost: Union[float, DefaultType]
@@ -3458,7 +3665,7 @@ class TermQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TermsLookup(AttrDict[Any]):
@@ -3469,6 +3676,8 @@ class TermsLookup(AttrDict[Any]):
     :arg routing:
     """
 
+    __slots__ = ()
+
     index: Union[str, DefaultType]
     id: Union[str, DefaultType]
     path: Union[str, InstrumentedField, DefaultType]
@@ -3491,7 +3700,7 @@ class TermsLookup(AttrDict[Any]):
             kwargs["path"] = str(path)
         if routing is not DEFAULT:
             kwargs["routing"] = routing
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TermsPartition(AttrDict[Any]):
@@ -3500,6 +3709,8 @@ class TermsPartition(AttrDict[Any]):
     :arg partition: (required) The partition number for this request.
     """
 
+    __slots__ = ()
+
     num_partitions: Union[int, DefaultType]
     partition: Union[int, DefaultType]
 
@@ -3514,7 +3725,7 @@ class TermsPartition(AttrDict[Any]):
             kwargs["num_partitions"] = num_partitions
         if partition is not DEFAULT:
             kwargs["partition"] = partition
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TermsSetQuery(AttrDict[Any]):
@@ -3535,10 +3746,12 @@ class TermsSetQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     terms: Union[Sequence[str], DefaultType]
     minimum_should_match: Union[int, str, DefaultType]
     minimum_should_match_field: Union[str, InstrumentedField, DefaultType]
-    minimum_should_match_script: Union["Script", Dict[str, Any], DefaultType]
+    minimum_should_match_script: Union[Script, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3551,7 +3764,7 @@ class TermsSetQuery(AttrDict[Any]):
             str, InstrumentedField, DefaultType
         ] = DEFAULT,
         minimum_should_match_script: Union[
-            "Script", Dict[str, Any], DefaultType
+            Script, Dict[str, Any], DefaultType
         ] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
@@ -3569,7 +3782,7 @@ class TermsSetQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TestPopulation(AttrDict[Any]):
@@ -3580,15 +3793,17 @@ class TestPopulation(AttrDict[Any]):
         t-test on.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
-    script: Union["Script", Dict[str, Any], DefaultType]
+    script: Union[Script, Dict[str, Any], DefaultType]
     filter: Union[Query, DefaultType]
 
     def __init__(
         self,
         *,
         field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         filter: Union[Query, DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
@@ -3598,7 +3813,7 @@ class TestPopulation(AttrDict[Any]):
             kwargs["script"] = script
         if filter is not DEFAULT:
             kwargs["filter"] = filter
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TextEmbedding(AttrDict[Any]):
@@ -3607,6 +3822,8 @@ class TextEmbedding(AttrDict[Any]):
     :arg model_text: (required)
     """
 
+    __slots__ = ()
+
     model_id: Union[str, DefaultType]
     model_text: Union[str, DefaultType]
 
@@ -3621,7 +3838,7 @@ class TextEmbedding(AttrDict[Any]):
             kwargs["model_id"] = model_id
         if model_text is not DEFAULT:
             kwargs["model_text"] = model_text
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TextExpansionQuery(AttrDict[Any]):
@@ -3637,9 +3854,11 @@ class TextExpansionQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     model_id: Union[str, DefaultType]
     model_text: Union[str, DefaultType]
-    pruning_config: Union["TokenPruningConfig", Dict[str, Any], DefaultType]
+    pruning_config: Union[TokenPruningConfig, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3649,7 +3868,7 @@ class TextExpansionQuery(AttrDict[Any]):
         model_id: Union[str, DefaultType] = DEFAULT,
         model_text: Union[str, DefaultType] = DEFAULT,
         pruning_config: Union[
-            "TokenPruningConfig", Dict[str, Any], DefaultType
+            TokenPruningConfig, Dict[str, Any], DefaultType
         ] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
@@ -3665,7 +3884,7 @@ class TextExpansionQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TokenPruningConfig(AttrDict[Any]):
@@ -3681,6 +3900,8 @@ class TokenPruningConfig(AttrDict[Any]):
         only scoring kept tokens.
     """
 
+    __slots__ = ()
+
     tokens_freq_ratio_threshold: Union[int, DefaultType]
     tokens_weight_threshold: Union[float, DefaultType]
     only_score_pruned_tokens: Union[bool, DefaultType]
@@ -3699,7 +3920,7 @@ class TokenPruningConfig(AttrDict[Any]):
             kwargs["tokens_weight_threshold"] = tokens_weight_threshold
         if only_score_pruned_tokens is not DEFAULT:
             kwargs["only_score_pruned_tokens"] = only_score_pruned_tokens
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TopLeftBottomRightGeoBounds(AttrDict[Any]):
@@ -3708,17 +3929,19 @@ class TopLeftBottomRightGeoBounds(AttrDict[Any]):
     :arg bottom_right: (required)
     """
 
+    __slots__ = ()
+
     top_left: Union[
-        "LatLonGeoLocation",
-        "GeoHashLocation",
+        LatLonGeoLocation,
+        GeoHashLocation,
         Sequence[float],
         str,
         Dict[str, Any],
         DefaultType,
     ]
     bottom_right: Union[
-        "LatLonGeoLocation",
-        "GeoHashLocation",
+        LatLonGeoLocation,
+        GeoHashLocation,
         Sequence[float],
         str,
         Dict[str, Any],
@@ -3729,16 +3952,16 @@ class TopLeftBottomRightGeoBounds(AttrDict[Any]):
         self,
         *,
         top_left: Union[
-            "LatLonGeoLocation",
-            "GeoHashLocation",
+            LatLonGeoLocation,
+            GeoHashLocation,
             Sequence[float],
             str,
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
         bottom_right: Union[
-            "LatLonGeoLocation",
-            "GeoHashLocation",
+            LatLonGeoLocation,
+            GeoHashLocation,
             Sequence[float],
             str,
             Dict[str, Any],
@@ -3750,7 +3973,7 @@ class TopLeftBottomRightGeoBounds(AttrDict[Any]):
             kwargs["top_left"] = top_left
         if bottom_right is not DEFAULT:
             kwargs["bottom_right"] = bottom_right
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TopMetricsValue(AttrDict[Any]):
@@ -3758,6 +3981,8 @@ class TopMetricsValue(AttrDict[Any]):
     :arg field: (required) A field to return as a metric.
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
 
     def __init__(
@@ -3768,7 +3993,7 @@ class TopMetricsValue(AttrDict[Any]):
     ):
         if field is not DEFAULT:
             kwargs["field"] = str(field)
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class TopRightBottomLeftGeoBounds(AttrDict[Any]):
@@ -3777,17 +4002,19 @@ class TopRightBottomLeftGeoBounds(AttrDict[Any]):
     :arg bottom_left: (required)
     """
 
+    __slots__ = ()
+
     top_right: Union[
-        "LatLonGeoLocation",
-        "GeoHashLocation",
+        LatLonGeoLocation,
+        GeoHashLocation,
         Sequence[float],
         str,
         Dict[str, Any],
         DefaultType,
     ]
     bottom_left: Union[
-        "LatLonGeoLocation",
-        "GeoHashLocation",
+        LatLonGeoLocation,
+        GeoHashLocation,
         Sequence[float],
         str,
         Dict[str, Any],
@@ -3798,16 +4025,16 @@ class TopRightBottomLeftGeoBounds(AttrDict[Any]):
         self,
         *,
         top_right: Union[
-            "LatLonGeoLocation",
-            "GeoHashLocation",
+            LatLonGeoLocation,
+            GeoHashLocation,
             Sequence[float],
             str,
             Dict[str, Any],
             DefaultType,
         ] = DEFAULT,
         bottom_left: Union[
-            "LatLonGeoLocation",
-            "GeoHashLocation",
+            LatLonGeoLocation,
+            GeoHashLocation,
             Sequence[float],
             str,
             Dict[str, Any],
@@ -3819,7 +4046,7 @@ class TopRightBottomLeftGeoBounds(AttrDict[Any]):
             kwargs["top_right"] = top_right
         if bottom_left is not DEFAULT:
             kwargs["bottom_left"] = bottom_left
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class WeightedAverageValue(AttrDict[Any]):
@@ -3829,16 +4056,18 @@ class WeightedAverageValue(AttrDict[Any]):
     :arg script:
     """
 
+    __slots__ = ()
+
     field: Union[str, InstrumentedField, DefaultType]
     missing: Union[float, DefaultType]
-    script: Union["Script", Dict[str, Any], DefaultType]
+    script: Union[Script, Dict[str, Any], DefaultType]
 
     def __init__(
         self,
         *,
         field: Union[str, InstrumentedField, DefaultType] = DEFAULT,
         missing: Union[float, DefaultType] = DEFAULT,
-        script: Union["Script", Dict[str, Any], DefaultType] = DEFAULT,
+        script: Union[Script, Dict[str, Any], DefaultType] = DEFAULT,
         **kwargs: Any,
     ):
         if field is not DEFAULT:
@@ -3847,7 +4076,7 @@ class WeightedAverageValue(AttrDict[Any]):
             kwargs["missing"] = missing
         if script is not DEFAULT:
             kwargs["script"] = script
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class WeightedTokensQuery(AttrDict[Any]):
@@ -3862,8 +4091,10 @@ class WeightedTokensQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     tokens: Union[Mapping[str, float], DefaultType]
-    pruning_config: Union["TokenPruningConfig", Dict[str, Any], DefaultType]
+    pruning_config: Union[TokenPruningConfig, Dict[str, Any], DefaultType]
     boost: Union[float, DefaultType]
     _name: Union[str, DefaultType]
 
@@ -3872,7 +4103,7 @@ class WeightedTokensQuery(AttrDict[Any]):
         *,
         tokens: Union[Mapping[str, float], DefaultType] = DEFAULT,
         pruning_config: Union[
-            "TokenPruningConfig", Dict[str, Any], DefaultType
+            TokenPruningConfig, Dict[str, Any], DefaultType
         ] = DEFAULT,
         boost: Union[float, DefaultType] = DEFAULT,
         _name: Union[str, DefaultType] = DEFAULT,
@@ -3886,7 +4117,7 @@ class WeightedTokensQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class WildcardQuery(AttrDict[Any]):
@@ -3908,6 +4139,8 @@ class WildcardQuery(AttrDict[Any]):
     :arg _name:
     """
 
+    __slots__ = ()
+
     case_insensitive: Union[bool, DefaultType]
     rewrite: Union[str, DefaultType]
     value: Union[str, DefaultType]
@@ -3938,7 +4171,7 @@ class WildcardQuery(AttrDict[Any]):
             kwargs["boost"] = boost
         if _name is not DEFAULT:
             kwargs["_name"] = _name
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class WktGeoBounds(AttrDict[Any]):
@@ -3946,12 +4179,14 @@ class WktGeoBounds(AttrDict[Any]):
     :arg wkt: (required)
     """
 
+    __slots__ = ()
+
     wkt: Union[str, DefaultType]
 
     def __init__(self, *, wkt: Union[str, DefaultType] = DEFAULT, **kwargs: Any):
         if wkt is not DEFAULT:
             kwargs["wkt"] = wkt
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
 
 
 class AdjacencyMatrixAggregate(AttrDict[Any]):
@@ -3960,11 +4195,13 @@ class AdjacencyMatrixAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["AdjacencyMatrixBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[AdjacencyMatrixBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "AdjacencyMatrixBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, AdjacencyMatrixBucket]:
         return self.buckets  # type: ignore
 
 
@@ -3974,6 +4211,8 @@ class AdjacencyMatrixBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     doc_count: int
 
@@ -3994,6 +4233,8 @@ class AggregationBreakdown(AttrDict[Any]):
     :arg post_collection_count:
     """
 
+    __slots__ = ()
+
     build_aggregation: int
     build_aggregation_count: int
     build_leaf_collector: int
@@ -4018,12 +4259,14 @@ class AggregationProfile(AttrDict[Any]):
     :arg children:
     """
 
-    breakdown: "AggregationBreakdown"
+    __slots__ = ()
+
+    breakdown: AggregationBreakdown
     description: str
     time_in_nanos: Any
     type: str
-    debug: "AggregationProfileDebug"
-    children: Sequence["AggregationProfile"]
+    debug: AggregationProfileDebug
+    children: Sequence[AggregationProfile]
 
 
 class AggregationProfileDebug(AttrDict[Any]):
@@ -4062,6 +4305,8 @@ class AggregationProfileDebug(AttrDict[Any]):
     :arg skipped_due_to_no_data:
     """
 
+    __slots__ = ()
+
     segments_with_multi_valued_ords: int
     collection_strategy: str
     segments_with_single_valued_ords: int
@@ -4070,7 +4315,7 @@ class AggregationProfileDebug(AttrDict[Any]):
     result_strategy: str
     has_filter: bool
     delegate: str
-    delegate_debug: "AggregationProfileDebug"
+    delegate_debug: AggregationProfileDebug
     chars_fetched: int
     extract_count: int
     extract_ns: int
@@ -4086,7 +4331,7 @@ class AggregationProfileDebug(AttrDict[Any]):
     deferred_aggregators: Sequence[str]
     segments_with_doc_count_field: int
     segments_with_deleted_docs: int
-    filters: Sequence["AggregationProfileDelegateDebugFilter"]
+    filters: Sequence[AggregationProfileDelegateDebugFilter]
     segments_counted: int
     segments_collected: int
     map_reducer: str
@@ -4104,6 +4349,8 @@ class AggregationProfileDelegateDebugFilter(AttrDict[Any]):
     :arg segments_counted_in_constant_time:
     """
 
+    __slots__ = ()
+
     results_from_metadata: int
     query: str
     specialized_for: str
@@ -4117,6 +4364,8 @@ class ArrayPercentilesItem(AttrDict[Any]):
     :arg value_as_string:
     """
 
+    __slots__ = ()
+
     key: str
     value: Union[float, None]
     value_as_string: str
@@ -4129,12 +4378,14 @@ class AutoDateHistogramAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     interval: str
-    buckets: Sequence["DateHistogramBucket"]
+    buckets: Sequence[DateHistogramBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "DateHistogramBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, DateHistogramBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4147,6 +4398,8 @@ class AvgAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -4171,6 +4424,8 @@ class BoxPlotAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     min: float
     max: float
     q1: float
@@ -4198,6 +4453,8 @@ class BucketMetricValueAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     keys: Sequence[str]  # type: ignore[assignment]
     value: Union[float, None]
     value_as_string: str
@@ -4213,7 +4470,9 @@ class BulkIndexByScrollFailure(AttrDict[Any]):
     :arg type: (required)
     """
 
-    cause: "ErrorCause"
+    __slots__ = ()
+
+    cause: ErrorCause
     id: str
     index: str
     status: int
@@ -4226,6 +4485,8 @@ class CardinalityAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: int
     meta: Mapping[str, Any]
 
@@ -4236,6 +4497,8 @@ class ChildrenAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -4250,12 +4513,14 @@ class ClusterDetails(AttrDict[Any]):
     :arg failures:
     """
 
+    __slots__ = ()
+
     status: Literal["running", "successful", "partial", "skipped", "failed"]
     indices: str
     timed_out: bool
     took: Any
-    _shards: "ShardStatistics"
-    failures: Sequence["ShardFailure"]
+    _shards: ShardStatistics
+    failures: Sequence[ShardFailure]
 
 
 class ClusterStatistics(AttrDict[Any]):
@@ -4269,13 +4534,15 @@ class ClusterStatistics(AttrDict[Any]):
     :arg details:
     """
 
+    __slots__ = ()
+
     skipped: int
     successful: int
     total: int
     running: int
     partial: int
     failed: int
-    details: Mapping[str, "ClusterDetails"]
+    details: Mapping[str, ClusterDetails]
 
 
 class Collector(AttrDict[Any]):
@@ -4286,10 +4553,12 @@ class Collector(AttrDict[Any]):
     :arg children:
     """
 
+    __slots__ = ()
+
     name: str
     reason: str
     time_in_nanos: Any
-    children: Sequence["Collector"]
+    children: Sequence[Collector]
 
 
 class CompletionSuggest(AttrDict[Any]):
@@ -4300,7 +4569,9 @@ class CompletionSuggest(AttrDict[Any]):
     :arg text: (required)
     """
 
-    options: Sequence["CompletionSuggestOption"]
+    __slots__ = ()
+
+    options: Sequence[CompletionSuggestOption]
     length: int
     offset: int
     text: str
@@ -4320,14 +4591,14 @@ class CompletionSuggestOption(AttrDict[Any]):
     :arg score:
     """
 
+    __slots__ = ()
+
     text: str
     collate_match: bool
     contexts: Mapping[
         str,
         Sequence[
-            Union[
-                str, Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]
-            ]
+            Union[str, Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]]
         ],
     ]
     fields: Mapping[str, Any]
@@ -4346,12 +4617,14 @@ class CompositeAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     after_key: Mapping[str, Union[int, float, str, bool, None, Any]]
-    buckets: Sequence["CompositeBucket"]
+    buckets: Sequence[CompositeBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "CompositeBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, CompositeBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4361,6 +4634,8 @@ class CompositeBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: Mapping[str, Union[int, float, str, bool, None, Any]]
     doc_count: int
 
@@ -4374,6 +4649,8 @@ class CumulativeCardinalityAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: int
     value_as_string: str
     meta: Mapping[str, Any]
@@ -4385,11 +4662,13 @@ class DateHistogramAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["DateHistogramBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[DateHistogramBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "DateHistogramBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, DateHistogramBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4400,6 +4679,8 @@ class DateHistogramBucket(AttrDict[Any]):
     :arg key_as_string:
     """
 
+    __slots__ = ()
+
     key: Any
     doc_count: int
     key_as_string: str
@@ -4415,11 +4696,13 @@ class DateRangeAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["RangeBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[RangeBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "RangeBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, RangeBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4434,6 +4717,8 @@ class DerivativeAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     normalized_value: float
     normalized_value_as_string: str
@@ -4449,9 +4734,11 @@ class DfsKnnProfile(AttrDict[Any]):
     :arg vector_operations_count:
     """
 
-    query: Sequence["KnnQueryProfileResult"]
+    __slots__ = ()
+
+    query: Sequence[KnnQueryProfileResult]
     rewrite_time: int
-    collector: Sequence["KnnCollectorResult"]
+    collector: Sequence[KnnCollectorResult]
     vector_operations_count: int
 
 
@@ -4461,8 +4748,10 @@ class DfsProfile(AttrDict[Any]):
     :arg knn:
     """
 
-    statistics: "DfsStatisticsProfile"
-    knn: Sequence["DfsKnnProfile"]
+    __slots__ = ()
+
+    statistics: DfsStatisticsProfile
+    knn: Sequence[DfsKnnProfile]
 
 
 class DfsStatisticsBreakdown(AttrDict[Any]):
@@ -4477,6 +4766,8 @@ class DfsStatisticsBreakdown(AttrDict[Any]):
     :arg term_statistics_count: (required)
     """
 
+    __slots__ = ()
+
     collection_statistics: int
     collection_statistics_count: int
     create_weight: int
@@ -4498,13 +4789,15 @@ class DfsStatisticsProfile(AttrDict[Any]):
     :arg children:
     """
 
+    __slots__ = ()
+
     type: str
     description: str
     time_in_nanos: Any
-    breakdown: "DfsStatisticsBreakdown"
+    breakdown: DfsStatisticsBreakdown
     time: Any
     debug: Mapping[str, Any]
-    children: Sequence["DfsStatisticsProfile"]
+    children: Sequence[DfsStatisticsProfile]
 
 
 class DoubleTermsAggregate(AttrDict[Any]):
@@ -4518,13 +4811,15 @@ class DoubleTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count_error_upper_bound: int
     sum_other_doc_count: int
-    buckets: Sequence["DoubleTermsBucket"]
+    buckets: Sequence[DoubleTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "DoubleTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, DoubleTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4536,6 +4831,8 @@ class DoubleTermsBucket(AttrDict[Any]):
     :arg doc_count_error_upper_bound:
     """
 
+    __slots__ = ()
+
     key: float
     doc_count: int
     key_as_string: str
@@ -4557,12 +4854,14 @@ class ErrorCause(AttrDict[Any]):
     :arg suppressed:
     """
 
+    __slots__ = ()
+
     type: str
     reason: str
     stack_trace: str
-    caused_by: "ErrorCause"
-    root_cause: Sequence["ErrorCause"]
-    suppressed: Sequence["ErrorCause"]
+    caused_by: ErrorCause
+    root_cause: Sequence[ErrorCause]
+    suppressed: Sequence[ErrorCause]
 
 
 class Explanation(AttrDict[Any]):
@@ -4572,8 +4871,10 @@ class Explanation(AttrDict[Any]):
     :arg value: (required)
     """
 
+    __slots__ = ()
+
     description: str
-    details: Sequence["ExplanationDetail"]
+    details: Sequence[ExplanationDetail]
     value: float
 
 
@@ -4584,9 +4885,11 @@ class ExplanationDetail(AttrDict[Any]):
     :arg details:
     """
 
+    __slots__ = ()
+
     description: str
     value: float
-    details: Sequence["ExplanationDetail"]
+    details: Sequence[ExplanationDetail]
 
 
 class ExtendedStatsAggregate(AttrDict[Any]):
@@ -4617,6 +4920,8 @@ class ExtendedStatsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     sum_of_squares: Union[float, None]
     variance: Union[float, None]
     variance_population: Union[float, None]
@@ -4629,13 +4934,13 @@ class ExtendedStatsAggregate(AttrDict[Any]):
     max: Union[float, None]
     avg: Union[float, None]
     sum: float
-    std_deviation_bounds: "StandardDeviationBounds"
+    std_deviation_bounds: StandardDeviationBounds
     sum_of_squares_as_string: str
     variance_as_string: str
     variance_population_as_string: str
     variance_sampling_as_string: str
     std_deviation_as_string: str
-    std_deviation_bounds_as_string: "StandardDeviationBoundsAsString"
+    std_deviation_bounds_as_string: StandardDeviationBoundsAsString
     min_as_string: str
     max_as_string: str
     avg_as_string: str
@@ -4671,6 +4976,8 @@ class ExtendedStatsBucketAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     sum_of_squares: Union[float, None]
     variance: Union[float, None]
     variance_population: Union[float, None]
@@ -4683,13 +4990,13 @@ class ExtendedStatsBucketAggregate(AttrDict[Any]):
     max: Union[float, None]
     avg: Union[float, None]
     sum: float
-    std_deviation_bounds: "StandardDeviationBounds"
+    std_deviation_bounds: StandardDeviationBounds
     sum_of_squares_as_string: str
     variance_as_string: str
     variance_population_as_string: str
     variance_sampling_as_string: str
     std_deviation_as_string: str
-    std_deviation_bounds_as_string: "StandardDeviationBoundsAsString"
+    std_deviation_bounds_as_string: StandardDeviationBoundsAsString
     min_as_string: str
     max_as_string: str
     avg_as_string: str
@@ -4707,12 +5014,14 @@ class FetchProfile(AttrDict[Any]):
     :arg children:
     """
 
+    __slots__ = ()
+
     type: str
     description: str
     time_in_nanos: Any
-    breakdown: "FetchProfileBreakdown"
-    debug: "FetchProfileDebug"
-    children: Sequence["FetchProfile"]
+    breakdown: FetchProfileBreakdown
+    debug: FetchProfileDebug
+    children: Sequence[FetchProfile]
 
 
 class FetchProfileBreakdown(AttrDict[Any]):
@@ -4727,6 +5036,8 @@ class FetchProfileBreakdown(AttrDict[Any]):
     :arg process:
     """
 
+    __slots__ = ()
+
     load_source: int
     load_source_count: int
     load_stored_fields: int
@@ -4743,6 +5054,8 @@ class FetchProfileDebug(AttrDict[Any]):
     :arg fast_path:
     """
 
+    __slots__ = ()
+
     stored_fields: Sequence[str]
     fast_path: int
 
@@ -4753,6 +5066,8 @@ class FilterAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -4763,11 +5078,13 @@ class FiltersAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["FiltersBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[FiltersBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "FiltersBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, FiltersBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4776,6 +5093,8 @@ class FiltersBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     doc_count: int
 
 
@@ -4785,11 +5104,13 @@ class FrequentItemSetsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["FrequentItemSetsBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[FrequentItemSetsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "FrequentItemSetsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, FrequentItemSetsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4800,6 +5121,8 @@ class FrequentItemSetsBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: Mapping[str, Sequence[str]]
     support: float
     doc_count: int
@@ -4811,11 +5134,13 @@ class GeoBoundsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     bounds: Union[
-        "CoordsGeoBounds",
-        "TopLeftBottomRightGeoBounds",
-        "TopRightBottomLeftGeoBounds",
-        "WktGeoBounds",
+        CoordsGeoBounds,
+        TopLeftBottomRightGeoBounds,
+        TopRightBottomLeftGeoBounds,
+        WktGeoBounds,
     ]
     meta: Mapping[str, Any]
 
@@ -4827,8 +5152,10 @@ class GeoCentroidAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     count: int
-    location: Union["LatLonGeoLocation", "GeoHashLocation", Sequence[float], str]
+    location: Union[LatLonGeoLocation, GeoHashLocation, Sequence[float], str]
     meta: Mapping[str, Any]
 
 
@@ -4841,11 +5168,13 @@ class GeoDistanceAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["RangeBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[RangeBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "RangeBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, RangeBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4855,11 +5184,13 @@ class GeoHashGridAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["GeoHashGridBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[GeoHashGridBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "GeoHashGridBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, GeoHashGridBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4869,6 +5200,8 @@ class GeoHashGridBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     doc_count: int
 
@@ -4879,11 +5212,13 @@ class GeoHexGridAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["GeoHexGridBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[GeoHexGridBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "GeoHexGridBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, GeoHexGridBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4893,6 +5228,8 @@ class GeoHexGridBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     doc_count: int
 
@@ -4905,6 +5242,8 @@ class GeoLine(AttrDict[Any]):
     :arg coordinates: (required) Array of `[lon, lat]` coordinates
     """
 
+    __slots__ = ()
+
     type: str
     coordinates: Sequence[Sequence[float]]
 
@@ -4917,8 +5256,10 @@ class GeoLineAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     type: str
-    geometry: "GeoLine"
+    geometry: GeoLine
     properties: Any
     meta: Mapping[str, Any]
 
@@ -4929,11 +5270,13 @@ class GeoTileGridAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["GeoTileGridBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[GeoTileGridBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "GeoTileGridBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, GeoTileGridBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4943,6 +5286,8 @@ class GeoTileGridBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     doc_count: int
 
@@ -4953,6 +5298,8 @@ class GlobalAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -4963,7 +5310,9 @@ class HdrPercentileRanksAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    values: Union[Mapping[str, Union[str, int, None]], Sequence["ArrayPercentilesItem"]]
+    __slots__ = ()
+
+    values: Union[Mapping[str, Union[str, int, None]], Sequence[ArrayPercentilesItem]]
     meta: Mapping[str, Any]
 
 
@@ -4973,7 +5322,9 @@ class HdrPercentilesAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    values: Union[Mapping[str, Union[str, int, None]], Sequence["ArrayPercentilesItem"]]
+    __slots__ = ()
+
+    values: Union[Mapping[str, Union[str, int, None]], Sequence[ArrayPercentilesItem]]
     meta: Mapping[str, Any]
 
 
@@ -4983,11 +5334,13 @@ class HistogramAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["HistogramBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[HistogramBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "HistogramBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, HistogramBucket]:
         return self.buckets  # type: ignore
 
 
@@ -4998,6 +5351,8 @@ class HistogramBucket(AttrDict[Any]):
     :arg key_as_string:
     """
 
+    __slots__ = ()
+
     key: float
     doc_count: int
     key_as_string: str
@@ -5027,15 +5382,17 @@ class Hit(AttrDict[Any]):
     :arg sort:
     """
 
+    __slots__ = ()
+
     index: str
     id: str
     score: Union[float, None]
-    explanation: "Explanation"
+    explanation: Explanation
     fields: Mapping[str, Any]
     highlight: Mapping[str, Sequence[str]]
-    inner_hits: Mapping[str, "InnerHitsResult"]
+    inner_hits: Mapping[str, InnerHitsResult]
     matched_queries: Union[Sequence[str], Mapping[str, float]]
-    nested: "NestedIdentity"
+    nested: NestedIdentity
     ignored: Sequence[str]
     ignored_field_values: Mapping[
         str, Sequence[Union[int, float, str, bool, None, Any]]
@@ -5059,8 +5416,10 @@ class HitsMetadata(AttrDict[Any]):
     :arg max_score:
     """
 
-    hits: Sequence["Hit"]
-    total: Union["TotalHits", int]
+    __slots__ = ()
+
+    hits: Sequence[Hit]
+    total: Union[TotalHits, int]
     max_score: Union[float, None]
 
 
@@ -5073,9 +5432,11 @@ class InferenceAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[int, float, str, bool, None, Any]
-    feature_importance: Sequence["InferenceFeatureImportance"]
-    top_classes: Sequence["InferenceTopClassEntry"]
+    feature_importance: Sequence[InferenceFeatureImportance]
+    top_classes: Sequence[InferenceTopClassEntry]
     warning: str
     meta: Mapping[str, Any]
 
@@ -5086,6 +5447,8 @@ class InferenceClassImportance(AttrDict[Any]):
     :arg importance: (required)
     """
 
+    __slots__ = ()
+
     class_name: str
     importance: float
 
@@ -5097,9 +5460,11 @@ class InferenceFeatureImportance(AttrDict[Any]):
     :arg classes:
     """
 
+    __slots__ = ()
+
     feature_name: str
     importance: float
-    classes: Sequence["InferenceClassImportance"]
+    classes: Sequence[InferenceClassImportance]
 
 
 class InferenceTopClassEntry(AttrDict[Any]):
@@ -5109,6 +5474,8 @@ class InferenceTopClassEntry(AttrDict[Any]):
     :arg class_score: (required)
     """
 
+    __slots__ = ()
+
     class_name: Union[int, float, str, bool, None, Any]
     class_probability: float
     class_score: float
@@ -5119,7 +5486,9 @@ class InnerHitsResult(AttrDict[Any]):
     :arg hits: (required)
     """
 
-    hits: "HitsMetadata"
+    __slots__ = ()
+
+    hits: HitsMetadata
 
 
 class IpPrefixAggregate(AttrDict[Any]):
@@ -5128,11 +5497,13 @@ class IpPrefixAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["IpPrefixBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[IpPrefixBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "IpPrefixBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, IpPrefixBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5145,6 +5516,8 @@ class IpPrefixBucket(AttrDict[Any]):
     :arg netmask:
     """
 
+    __slots__ = ()
+
     is_ipv6: bool
     key: str
     prefix_length: int
@@ -5158,11 +5531,13 @@ class IpRangeAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["IpRangeBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[IpRangeBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "IpRangeBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, IpRangeBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5174,6 +5549,8 @@ class IpRangeBucket(AttrDict[Any]):
     :arg to:
     """
 
+    __slots__ = ()
+
     doc_count: int
     key: str
     from_: str
@@ -5189,11 +5566,13 @@ class KnnCollectorResult(AttrDict[Any]):
     :arg children:
     """
 
+    __slots__ = ()
+
     name: str
     reason: str
     time_in_nanos: Any
     time: Any
-    children: Sequence["KnnCollectorResult"]
+    children: Sequence[KnnCollectorResult]
 
 
 class KnnQueryProfileBreakdown(AttrDict[Any]):
@@ -5220,6 +5599,8 @@ class KnnQueryProfileBreakdown(AttrDict[Any]):
     :arg shallow_advance_count: (required)
     """
 
+    __slots__ = ()
+
     advance: int
     advance_count: int
     build_scorer: int
@@ -5253,13 +5634,15 @@ class KnnQueryProfileResult(AttrDict[Any]):
     :arg children:
     """
 
+    __slots__ = ()
+
     type: str
     description: str
     time_in_nanos: Any
-    breakdown: "KnnQueryProfileBreakdown"
+    breakdown: KnnQueryProfileBreakdown
     time: Any
     debug: Mapping[str, Any]
-    children: Sequence["KnnQueryProfileResult"]
+    children: Sequence[KnnQueryProfileResult]
 
 
 class LongRareTermsAggregate(AttrDict[Any]):
@@ -5271,11 +5654,13 @@ class LongRareTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["LongRareTermsBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[LongRareTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "LongRareTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, LongRareTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5286,6 +5671,8 @@ class LongRareTermsBucket(AttrDict[Any]):
     :arg key_as_string:
     """
 
+    __slots__ = ()
+
     key: int
     doc_count: int
     key_as_string: str
@@ -5302,13 +5689,15 @@ class LongTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count_error_upper_bound: int
     sum_other_doc_count: int
-    buckets: Sequence["LongTermsBucket"]
+    buckets: Sequence[LongTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "LongTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, LongTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5320,6 +5709,8 @@ class LongTermsBucket(AttrDict[Any]):
     :arg doc_count_error_upper_bound:
     """
 
+    __slots__ = ()
+
     key: int
     doc_count: int
     key_as_string: str
@@ -5333,8 +5724,10 @@ class MatrixStatsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
-    fields: Sequence["MatrixStatsFields"]
+    fields: Sequence[MatrixStatsFields]
     meta: Mapping[str, Any]
 
 
@@ -5350,6 +5743,8 @@ class MatrixStatsFields(AttrDict[Any]):
     :arg correlation: (required)
     """
 
+    __slots__ = ()
+
     name: str
     count: int
     mean: float
@@ -5369,6 +5764,8 @@ class MaxAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -5383,6 +5780,8 @@ class MedianAbsoluteDeviationAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -5397,6 +5796,8 @@ class MinAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -5408,6 +5809,8 @@ class MissingAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -5420,13 +5823,15 @@ class MultiTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count_error_upper_bound: int
     sum_other_doc_count: int
-    buckets: Sequence["MultiTermsBucket"]
+    buckets: Sequence[MultiTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "MultiTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, MultiTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5438,6 +5843,8 @@ class MultiTermsBucket(AttrDict[Any]):
     :arg doc_count_error_upper_bound:
     """
 
+    __slots__ = ()
+
     key: Sequence[Union[int, float, str, bool, None, Any]]
     doc_count: int
     key_as_string: str
@@ -5450,6 +5857,8 @@ class NestedAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -5461,9 +5870,11 @@ class NestedIdentity(AttrDict[Any]):
     :arg _nested:
     """
 
+    __slots__ = ()
+
     field: str
     offset: int
-    _nested: "NestedIdentity"
+    _nested: NestedIdentity
 
 
 class ParentAggregate(AttrDict[Any]):
@@ -5472,6 +5883,8 @@ class ParentAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -5482,7 +5895,9 @@ class PercentilesBucketAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    values: Union[Mapping[str, Union[str, int, None]], Sequence["ArrayPercentilesItem"]]
+    __slots__ = ()
+
+    values: Union[Mapping[str, Union[str, int, None]], Sequence[ArrayPercentilesItem]]
     meta: Mapping[str, Any]
 
 
@@ -5494,7 +5909,9 @@ class PhraseSuggest(AttrDict[Any]):
     :arg text: (required)
     """
 
-    options: Sequence["PhraseSuggestOption"]
+    __slots__ = ()
+
+    options: Sequence[PhraseSuggestOption]
     length: int
     offset: int
     text: str
@@ -5508,6 +5925,8 @@ class PhraseSuggestOption(AttrDict[Any]):
     :arg collate_match:
     """
 
+    __slots__ = ()
+
     text: str
     score: float
     highlighted: str
@@ -5519,7 +5938,9 @@ class Profile(AttrDict[Any]):
     :arg shards: (required)
     """
 
-    shards: Sequence["ShardProfile"]
+    __slots__ = ()
+
+    shards: Sequence[ShardProfile]
 
 
 class QueryBreakdown(AttrDict[Any]):
@@ -5546,6 +5967,8 @@ class QueryBreakdown(AttrDict[Any]):
     :arg set_min_competitive_score_count: (required)
     """
 
+    __slots__ = ()
+
     advance: int
     advance_count: int
     build_scorer: int
@@ -5577,11 +6000,13 @@ class QueryProfile(AttrDict[Any]):
     :arg children:
     """
 
-    breakdown: "QueryBreakdown"
+    __slots__ = ()
+
+    breakdown: QueryBreakdown
     description: str
     time_in_nanos: Any
     type: str
-    children: Sequence["QueryProfile"]
+    children: Sequence[QueryProfile]
 
 
 class RangeAggregate(AttrDict[Any]):
@@ -5590,11 +6015,13 @@ class RangeAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["RangeBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[RangeBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "RangeBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, RangeBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5608,6 +6035,8 @@ class RangeBucket(AttrDict[Any]):
     :arg key: The bucket key. Present if the aggregation is _not_ keyed
     """
 
+    __slots__ = ()
+
     doc_count: int
     from_: float
     to: float
@@ -5623,6 +6052,8 @@ class RateAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: float
     value_as_string: str
     meta: Mapping[str, Any]
@@ -5634,6 +6065,8 @@ class Retries(AttrDict[Any]):
     :arg search: (required)
     """
 
+    __slots__ = ()
+
     bulk: int
     search: int
 
@@ -5644,6 +6077,8 @@ class ReverseNestedAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -5654,6 +6089,8 @@ class SamplerAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -5664,6 +6101,8 @@ class ScriptedMetricAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Any
     meta: Mapping[str, Any]
 
@@ -5675,8 +6114,10 @@ class SearchProfile(AttrDict[Any]):
     :arg rewrite_time: (required)
     """
 
-    collector: Sequence["Collector"]
-    query: Sequence["QueryProfile"]
+    __slots__ = ()
+
+    collector: Sequence[Collector]
+    query: Sequence[QueryProfile]
     rewrite_time: int
 
 
@@ -5689,7 +6130,9 @@ class ShardFailure(AttrDict[Any]):
     :arg status:
     """
 
-    reason: "ErrorCause"
+    __slots__ = ()
+
+    reason: ErrorCause
     shard: int
     index: str
     node: str
@@ -5709,15 +6152,17 @@ class ShardProfile(AttrDict[Any]):
     :arg fetch:
     """
 
-    aggregations: Sequence["AggregationProfile"]
+    __slots__ = ()
+
+    aggregations: Sequence[AggregationProfile]
     cluster: str
     id: str
     index: str
     node_id: str
-    searches: Sequence["SearchProfile"]
+    searches: Sequence[SearchProfile]
     shard_id: int
-    dfs: "DfsProfile"
-    fetch: "FetchProfile"
+    dfs: DfsProfile
+    fetch: FetchProfile
 
 
 class ShardStatistics(AttrDict[Any]):
@@ -5731,10 +6176,12 @@ class ShardStatistics(AttrDict[Any]):
     :arg skipped:
     """
 
+    __slots__ = ()
+
     failed: int
     successful: int
     total: int
-    failures: Sequence["ShardFailure"]
+    failures: Sequence[ShardFailure]
     skipped: int
 
 
@@ -5746,13 +6193,15 @@ class SignificantLongTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     bg_count: int
     doc_count: int
-    buckets: Sequence["SignificantLongTermsBucket"]
+    buckets: Sequence[SignificantLongTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "SignificantLongTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, SignificantLongTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5765,6 +6214,8 @@ class SignificantLongTermsBucket(AttrDict[Any]):
     :arg key_as_string:
     """
 
+    __slots__ = ()
+
     key: int
     score: float
     bg_count: int
@@ -5780,13 +6231,15 @@ class SignificantStringTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     bg_count: int
     doc_count: int
-    buckets: Sequence["SignificantStringTermsBucket"]
+    buckets: Sequence[SignificantStringTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "SignificantStringTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, SignificantStringTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5798,6 +6251,8 @@ class SignificantStringTermsBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     score: float
     bg_count: int
@@ -5813,6 +6268,8 @@ class SimpleValueAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -5828,6 +6285,8 @@ class StandardDeviationBounds(AttrDict[Any]):
     :arg lower_sampling: (required)
     """
 
+    __slots__ = ()
+
     upper: Union[float, None]
     lower: Union[float, None]
     upper_population: Union[float, None]
@@ -5846,6 +6305,8 @@ class StandardDeviationBoundsAsString(AttrDict[Any]):
     :arg lower_sampling: (required)
     """
 
+    __slots__ = ()
+
     upper: str
     lower: str
     upper_population: str
@@ -5871,6 +6332,8 @@ class StatsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     count: int
     min: Union[float, None]
     max: Union[float, None]
@@ -5897,6 +6360,8 @@ class StatsBucketAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     count: int
     min: Union[float, None]
     max: Union[float, None]
@@ -5917,11 +6382,13 @@ class StringRareTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["StringRareTermsBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[StringRareTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "StringRareTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, StringRareTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5931,6 +6398,8 @@ class StringRareTermsBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: str
     doc_count: int
 
@@ -5949,6 +6418,8 @@ class StringStatsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     count: int
     min_length: Union[int, None]
     max_length: Union[int, None]
@@ -5971,13 +6442,15 @@ class StringTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count_error_upper_bound: int
     sum_other_doc_count: int
-    buckets: Sequence["StringTermsBucket"]
+    buckets: Sequence[StringTermsBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "StringTermsBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, StringTermsBucket]:
         return self.buckets  # type: ignore
 
 
@@ -5988,6 +6461,8 @@ class StringTermsBucket(AttrDict[Any]):
     :arg doc_count_error_upper_bound:
     """
 
+    __slots__ = ()
+
     key: Union[int, float, str, bool, None, Any]
     doc_count: int
     doc_count_error_upper_bound: int
@@ -6005,6 +6480,8 @@ class SumAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -6016,7 +6493,9 @@ class TDigestPercentileRanksAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    values: Union[Mapping[str, Union[str, int, None]], Sequence["ArrayPercentilesItem"]]
+    __slots__ = ()
+
+    values: Union[Mapping[str, Union[str, int, None]], Sequence[ArrayPercentilesItem]]
     meta: Mapping[str, Any]
 
 
@@ -6026,7 +6505,9 @@ class TDigestPercentilesAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    values: Union[Mapping[str, Union[str, int, None]], Sequence["ArrayPercentilesItem"]]
+    __slots__ = ()
+
+    values: Union[Mapping[str, Union[str, int, None]], Sequence[ArrayPercentilesItem]]
     meta: Mapping[str, Any]
 
 
@@ -6037,6 +6518,8 @@ class TTestAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -6050,7 +6533,9 @@ class TermSuggest(AttrDict[Any]):
     :arg text: (required)
     """
 
-    options: Sequence["TermSuggestOption"]
+    __slots__ = ()
+
+    options: Sequence[TermSuggestOption]
     length: int
     offset: int
     text: str
@@ -6065,6 +6550,8 @@ class TermSuggestOption(AttrDict[Any]):
     :arg collate_match:
     """
 
+    __slots__ = ()
+
     text: str
     score: float
     freq: int
@@ -6078,11 +6565,13 @@ class TimeSeriesAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["TimeSeriesBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[TimeSeriesBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "TimeSeriesBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, TimeSeriesBucket]:
         return self.buckets  # type: ignore
 
 
@@ -6092,6 +6581,8 @@ class TimeSeriesBucket(AttrDict[Any]):
     :arg doc_count: (required)
     """
 
+    __slots__ = ()
+
     key: Mapping[str, Union[int, float, str, bool, None, Any]]
     doc_count: int
 
@@ -6102,7 +6593,9 @@ class TopHitsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    hits: "HitsMetadata"
+    __slots__ = ()
+
+    hits: HitsMetadata
     meta: Mapping[str, Any]
 
 
@@ -6112,6 +6605,8 @@ class TopMetrics(AttrDict[Any]):
     :arg metrics: (required)
     """
 
+    __slots__ = ()
+
     sort: Sequence[Union[Union[int, float, str, bool, None, Any], None]]
     metrics: Mapping[str, Union[Union[int, float, str, bool, None, Any], None]]
 
@@ -6122,7 +6617,9 @@ class TopMetricsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    top: Sequence["TopMetrics"]
+    __slots__ = ()
+
+    top: Sequence[TopMetrics]
     meta: Mapping[str, Any]
 
 
@@ -6132,6 +6629,8 @@ class TotalHits(AttrDict[Any]):
     :arg value: (required)
     """
 
+    __slots__ = ()
+
     relation: Literal["eq", "gte"]
     value: int
 
@@ -6145,6 +6644,8 @@ class UnmappedRareTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     buckets: Sequence[Any]
     meta: Mapping[str, Any]
 
@@ -6159,6 +6660,8 @@ class UnmappedSamplerAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count: int
     meta: Mapping[str, Any]
 
@@ -6174,6 +6677,8 @@ class UnmappedSignificantTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     bg_count: int
     doc_count: int
     buckets: Sequence[Any]
@@ -6195,6 +6700,8 @@ class UnmappedTermsAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     doc_count_error_upper_bound: int
     sum_other_doc_count: int
     buckets: Sequence[Any]
@@ -6216,6 +6723,8 @@ class ValueCountAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
@@ -6227,11 +6736,13 @@ class VariableWidthHistogramAggregate(AttrDict[Any]):
     :arg meta:
     """
 
-    buckets: Sequence["VariableWidthHistogramBucket"]
+    __slots__ = ()
+
+    buckets: Sequence[VariableWidthHistogramBucket]
     meta: Mapping[str, Any]
 
     @property
-    def buckets_as_dict(self) -> Mapping[str, "VariableWidthHistogramBucket"]:
+    def buckets_as_dict(self) -> Mapping[str, VariableWidthHistogramBucket]:
         return self.buckets  # type: ignore
 
 
@@ -6246,6 +6757,8 @@ class VariableWidthHistogramBucket(AttrDict[Any]):
     :arg max_as_string:
     """
 
+    __slots__ = ()
+
     min: float
     key: float
     max: float
@@ -6267,6 +6780,8 @@ class WeightedAvgAggregate(AttrDict[Any]):
     :arg meta:
     """
 
+    __slots__ = ()
+
     value: Union[float, None]
     value_as_string: str
     meta: Mapping[str, Any]
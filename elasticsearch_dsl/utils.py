@@ -81,7 +81,15 @@ META_FIELDS = frozenset(
 ).union(DOC_META_FIELDS)
 
 
+# types of JSON values that never need wrapping
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 def _wrap(val: Any, obj_wrapper: Optional[Callable[[Any], Any]] = None) -> Any:
+    # most values in a response are scalars, return them before trying the
+    # more expensive isinstance checks
+    if type(val) in _SCALAR_TYPES:
+        return val
     if isinstance(val, dict):
         return AttrDict(val) if obj_wrapper is None else obj_wrapper(val)
     if isinstance(val, list):
@@ -164,12 +172,13 @@ class AttrDict(Generic[_ValT]):
     nested dsl dicts.
     """
 
+    __slots__ = ("_d_", "__weakref__")
     _d_: Dict[str, _ValT]
     RESERVED: Dict[str, str] = {"from_": "from"}
 
     def __init__(self, d: Dict[str, _ValT]):
         # assign the inner dict manually to prevent __setattr__ from firing
-        super().__setattr__("_d_", d)
+        object.__setattr__(self, "_d_", d)
 
     def __contains__(self, key: object) -> bool:
         return key in self._d_
@@ -312,6 +321,7 @@ class DslBase(metaclass=DslMeta):
           all values in the `must` attribute into Query objects)
     """
 
+    __slots__ = ("_params", "__weakref__")
     _param_defs: ClassVar[Dict[str, Dict[str, Union[str, bool]]]] = {}
 
     @classmethod
@@ -332,7 +342,7 @@ class DslBase(metaclass=DslMeta):
             _expand__to_dot = EXPAND__TO_DOT
         self._params: Dict[str, Any] = {}
         for pname, pvalue in params.items():
-            if pvalue == DEFAULT:
+            if pvalue is DEFAULT:
                 continue
             # expand "__" to dots
             if "__" in pname and _expand__to_dot:
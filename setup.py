@@ -46,7 +46,6 @@ develop_requires = [
     "pytest-cov",
     "pytest-mock",
     "pytest-asyncio",
-    "pytz",
     "coverage",
     # the following three are used by the vectors example and its tests
     "nltk",
@@ -59,7 +58,6 @@ develop_requires = [
     "mypy",
     "pyright",
     "types-python-dateutil",
-    "types-pytz",
     "types-tqdm",
 ]
 
@@ -15,6 +15,9 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import pickle
+import weakref
+
 from pytest import raises
 
 from elasticsearch_dsl import aggs, query, types
@@ -69,6 +72,26 @@ def test_A_passes_aggs_through() -> None:
     assert aggs.A(a) is a
 
 
+def test_A_from_dict_keeps_aggs_of_metric_aggs_as_dicts() -> None:
+    d = {"avg": {"field": "x"}, "aggs": {"s": {"sum": {"field": "y"}}}}
+    a = aggs.A(d)
+
+    assert isinstance(a, aggs.Avg)
+    # the nested definitions are not turned into Agg objects
+    assert a._params["aggs"] == {"s": {"sum": {"field": "y"}}}
+    assert a.to_dict() == {
+        "avg": {"field": "x", "aggs": {"s": {"sum": {"field": "y"}}}}
+    }
+
+
+def test_metric_agg_keeps_aggs_param_in_its_body() -> None:
+    a = aggs.A("avg", field="x", aggs={"m": {"max": {"field": "y"}}})
+
+    assert a.to_dict() == {
+        "avg": {"field": "x", "aggs": {"m": {"max": {"field": "y"}}}}
+    }
+
+
 def test_A_from_dict() -> None:
     d = {
         "terms": {"field": "tags"},
@@ -85,6 +108,24 @@ def test_A_from_dict() -> None:
     assert a.aggs.per_author == aggs.A("terms", field="author.raw")  # type: ignore[attr-defined]
 
 
+def test_A_from_dict_does_not_modify_the_dict() -> None:
+    d = {
+        "terms": {"field": "tags", "include": ["a", "b"]},
+        "aggs": {"per_author": {"terms": {"field": "author.raw"}}},
+        "meta": {"some": "metadata"},
+    }
+    a = aggs.A(d)
+    assert isinstance(a, aggs.Terms)
+    a["per_author"].bucket("per_year", "date_histogram", field="date")
+    a.include.append("c")
+
+    assert d == {
+        "terms": {"field": "tags", "include": ["a", "b"]},
+        "aggs": {"per_author": {"terms": {"field": "author.raw"}}},
+        "meta": {"some": "metadata"},
+    }
+
+
 def test_A_fails_with_incorrect_dict() -> None:
     correct_d = {
         "terms": {"field": "tags"},
@@ -111,6 +152,9 @@ def test_A_fails_with_agg_and_params() -> None:
     with raises(Exception):
         aggs.A(a, field="score")
 
+    with raises(ValueError):
+        aggs.A(a, query.Match(title="python"))
+
 
 def test_buckets_are_nestable() -> None:
     a = aggs.Terms(field="tags")
@@ -164,6 +208,20 @@ def test_nested_buckets_are_reachable_as_getitem() -> None:
     assert a["per_author"] == b
 
 
+def test_nested_buckets_accessed_as_getitem_are_copies() -> None:
+    a = aggs.Terms(field="tags")
+    b = a.bucket("per_author", "terms", field="author.raw")
+    b.metric("max_score", "max", field="score")
+
+    c = a["per_author"]
+    c.metric("min_score", "min", field="score")
+
+    assert isinstance(c, aggs.Terms)
+    assert c._base is c
+    assert "min_score" in c
+    assert "min_score" not in b
+
+
 def test_nested_buckets_are_settable_as_getitem() -> None:
     a = aggs.Terms(field="tags")
     b = a["per_author"] = aggs.A("terms", field="author.raw")
@@ -199,6 +257,15 @@ def test_filter_aggregation_with_nested_aggs() -> None:
     } == a.to_dict()
 
 
+def test_filter_aggregation_with_meta() -> None:
+    a = aggs.Filter(query.Q("term", f=42), meta={"some": "metadata"})
+
+    assert {
+        "filter": {"term": {"f": 42}},
+        "meta": {"some": "metadata"},
+    } == a.to_dict()
+
+
 def test_filters_correctly_identifies_the_hash() -> None:
     a = aggs.A(
         "filters",
@@ -528,3 +595,37 @@ def test_bucket_agg_with_filter() -> None:
     a.bucket("b", b)
 
     assert a.aggs["b"] == a["b"]  # a['b'] threw exception before patch #1902
+
+
+def test_buckets_can_be_pickled() -> None:
+    a = aggs.Terms(field="tags")
+    a.bucket("per_author", "terms", field="author").metric(
+        "avg_lines", "avg", field="lines"
+    )
+
+    b = pickle.loads(pickle.dumps(a))
+
+    assert a == b
+    assert b._base is b
+    assert not hasattr(b, "__dict__")
+
+
+def test_looking_up_missing_sub_aggs_does_not_modify_the_agg() -> None:
+    a = aggs.Terms(field="tags")
+
+    assert "per_author" not in a
+    assert list(a.__iter__()) == []
+    with raises(KeyError):
+        a["per_author"]
+
+    assert a._params == {"field": "tags"}
+
+
+def test_aggs_and_queries_can_be_weakly_referenced() -> None:
+    a = aggs.Terms(field="tags")
+    m = aggs.Avg(field="lines")
+    q = query.Match(title="python")
+
+    assert weakref.ref(a)() is a
+    assert weakref.ref(m)() is m
+    assert weakref.ref(q)() is q
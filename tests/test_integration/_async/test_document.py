@@ -26,10 +26,10 @@ from ipaddress import ip_address
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Tuple, Union
 
 import pytest
+from dateutil.tz import gettz
 from elasticsearch import AsyncElasticsearch, ConflictError, NotFoundError
 from elasticsearch.helpers.errors import BulkIndexError
 from pytest import raises
-from pytz import timezone
 
 from elasticsearch_dsl import (
     AsyncDocument,
@@ -428,23 +428,23 @@ async def test_get_with_tz_date(async_data_client: AsyncElasticsearch) -> None:
     )
     assert first_commit is not None
 
-    tzinfo = timezone("Europe/Prague")
+    tzinfo = gettz("Europe/Prague")
     assert (
-        tzinfo.localize(datetime(2014, 5, 2, 13, 47, 19, 123000))
+        datetime(2014, 5, 2, 13, 47, 19, 123000, tzinfo=tzinfo)
         == first_commit.authored_date
     )
 
 
 @pytest.mark.asyncio
 async def test_save_with_tz_date(async_data_client: AsyncElasticsearch) -> None:
-    tzinfo = timezone("Europe/Prague")
+    tzinfo = gettz("Europe/Prague")
     first_commit = await Commit.get(
         id="3ca6e1e73a071a705b4babd2f581c91a2a3e5037", routing="elasticsearch-dsl-py"
     )
     assert first_commit is not None
 
-    first_commit.committed_date = tzinfo.localize(
-        datetime(2014, 5, 2, 13, 47, 19, 123456)
+    first_commit.committed_date = datetime(
+        2014, 5, 2, 13, 47, 19, 123456, tzinfo=tzinfo
     )
     await first_commit.save()
 
@@ -454,7 +454,7 @@ async def test_save_with_tz_date(async_data_client: AsyncElasticsearch) -> None:
     assert first_commit is not None
 
     assert (
-        tzinfo.localize(datetime(2014, 5, 2, 13, 47, 19, 123456))
+        datetime(2014, 5, 2, 13, 47, 19, 123456, tzinfo=tzinfo)
         == first_commit.committed_date
     )
 
@@ -26,10 +26,10 @@ from ipaddress import ip_address
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple, Union
 
 import pytest
+from dateutil.tz import gettz
 from elasticsearch import ConflictError, Elasticsearch, NotFoundError
 from elasticsearch.helpers.errors import BulkIndexError
 from pytest import raises
-from pytz import timezone
 
 from elasticsearch_dsl import (
     Binary,
@@ -424,23 +424,23 @@ def test_get_with_tz_date(data_client: Elasticsearch) -> None:
     )
     assert first_commit is not None
 
-    tzinfo = timezone("Europe/Prague")
+    tzinfo = gettz("Europe/Prague")
     assert (
-        tzinfo.localize(datetime(2014, 5, 2, 13, 47, 19, 123000))
+        datetime(2014, 5, 2, 13, 47, 19, 123000, tzinfo=tzinfo)
         == first_commit.authored_date
     )
 
 
 @pytest.mark.sync
 def test_save_with_tz_date(data_client: Elasticsearch) -> None:
-    tzinfo = timezone("Europe/Prague")
+    tzinfo = gettz("Europe/Prague")
     first_commit = Commit.get(
         id="3ca6e1e73a071a705b4babd2f581c91a2a3e5037", routing="elasticsearch-dsl-py"
     )
     assert first_commit is not None
 
-    first_commit.committed_date = tzinfo.localize(
-        datetime(2014, 5, 2, 13, 47, 19, 123456)
+    first_commit.committed_date = datetime(
+        2014, 5, 2, 13, 47, 19, 123456, tzinfo=tzinfo
     )
     first_commit.save()
 
@@ -450,7 +450,7 @@ def test_save_with_tz_date(data_client: Elasticsearch) -> None:
     assert first_commit is not None
 
     assert (
-        tzinfo.localize(datetime(2014, 5, 2, 13, 47, 19, 123456))
+        datetime(2014, 5, 2, 13, 47, 19, 123456, tzinfo=tzinfo)
         == first_commit.committed_date
     )
 
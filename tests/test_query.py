@@ -15,9 +15,11 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from typing import List, get_type_hints
+
 from pytest import raises
 
-from elasticsearch_dsl import function, query, utils
+from elasticsearch_dsl import Document, InnerDoc, M, function, query, types, utils
 
 
 def test_empty_Q_is_match_all() -> None:
@@ -669,3 +671,100 @@ def test_knn_query() -> None:
             "num_candidates": 10,
         }
     }
+
+
+def test_inner_hits_with_instrumented_fields() -> None:
+    class Comment(InnerDoc):
+        author: M[str]
+        content: M[str]
+
+    class Post(Document):
+        comments: M[List[Comment]]
+
+    q = query.Nested(
+        path=Post.comments,
+        query=query.Match(comments__author="honza"),
+        inner_hits=types.InnerHits(
+            fields=[Post.comments.author, "comments.content"],
+            stored_fields=Post.comments.content,
+            sort=Post.comments.author,
+        ),
+    )
+
+    assert q.to_dict() == {
+        "nested": {
+            "path": "comments",
+            "query": {"match": {"comments.author": "honza"}},
+            "inner_hits": {
+                "fields": ["comments.author", "comments.content"],
+                "stored_fields": "comments.content",
+                "sort": "comments.author",
+            },
+        }
+    }
+
+
+def test_inner_hits_sort_list_with_instrumented_fields() -> None:
+    class Comment(InnerDoc):
+        author: M[str]
+        created_at: M[str]
+
+    class Post(Document):
+        comments: M[List[Comment]]
+
+    inner_hits = types.InnerHits(
+        sort=[
+            Post.comments.author,
+            {"comments.created_at": {"order": "desc"}},  # type: ignore[list-item]
+            types.SortOptions(_score={"order": "asc"}),
+        ]
+    )
+
+    assert inner_hits.to_dict() == {
+        "sort": [
+            "comments.author",
+            {"comments.created_at": {"order": "desc"}},
+            types.SortOptions(_score={"order": "asc"}),
+        ]
+    }
+
+
+def test_span_query_with_instrumented_field_keys() -> None:
+    class Post(Document):
+        title: M[str]
+
+    q = query.SpanNear(
+        clauses=[
+            types.SpanQuery(span_term={"title": types.SpanTermQuery(value="quick")}),
+            types.SpanQuery(span_gap={Post.title: 2}),
+        ]
+    )
+
+    assert q.to_dict() == {
+        "span_near": {
+            "clauses": [
+                {"span_term": {"title": {"value": "quick"}}},
+                {"span_gap": {"title": 2}},
+            ]
+        }
+    }
+
+
+def test_rank_feature_with_fieldless_function() -> None:
+    q = query.RankFeature(field="pagerank", linear=types.RankFeatureFunctionLinear())
+
+    assert q.to_dict() == {"rank_feature": {"field": "pagerank", "linear": {}}}
+
+
+def test_fieldless_types_accept_a_positional_dict() -> None:
+    d = {"min_doc_count": 1}
+    heuristic = types.PercentageScoreHeuristic(d)
+
+    assert heuristic.to_dict() is d
+    assert types.RankFeatureFunctionLinear({}).to_dict() == {}
+
+
+def test_types_annotations_can_be_resolved() -> None:
+    for cls in (types.InnerHits, types.NestedSortValue, types.Highlight):
+        get_type_hints(cls)
+        get_type_hints(cls.__init__)
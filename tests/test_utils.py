@@ -16,11 +16,12 @@
 #  under the License.
 
 import pickle
+import weakref
 from typing import Any, Dict, Tuple
 
 from pytest import raises
 
-from elasticsearch_dsl import Q, serializer, utils
+from elasticsearch_dsl import Q, serializer, types, utils
 
 
 def test_attrdict_pickle() -> None:
@@ -30,6 +31,21 @@ def test_attrdict_pickle() -> None:
     assert ad == pickle.loads(pickled_ad)
 
 
+def test_attrdict_subclass_pickle() -> None:
+    ih = types.InnerHits(name="comments", size=3)
+
+    assert not hasattr(ih, "__dict__")
+    assert ih == pickle.loads(pickle.dumps(ih))
+
+
+def test_attrdict_can_be_weakly_referenced() -> None:
+    ad = utils.AttrDict[Any]({})
+    ih = types.InnerHits(name="comments")
+
+    assert weakref.ref(ad)() is ad
+    assert weakref.ref(ih)() is ih
+
+
 def test_attrlist_pickle() -> None:
     al = utils.AttrList[Any]([])
 
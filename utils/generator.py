@@ -106,7 +106,9 @@ def type_for_types_py(type_):
     type_ = type_.replace('"DefaultType"', "DefaultType")
     type_ = type_.replace('"InstrumentedField"', "InstrumentedField")
     type_ = re.sub(r'"(function\.[a-zA-Z0-9_]+)"', r"\1", type_)
-    type_ = re.sub(r'"types\.([a-zA-Z0-9_]+)"', r'"\1"', type_)
+    # types.py postpones the evaluation of annotations, so references to
+    # other classes in the module don't need to be quoted
+    type_ = re.sub(r'"types\.([a-zA-Z0-9_]+)"', r"\1", type_)
     type_ = re.sub(r'"(wrappers\.[a-zA-Z0-9_]+)"', r"\1", type_)
     return type_
 
@@ -356,9 +358,9 @@ class ElasticsearchSchema:
         `k["params"]`.
 
         When `for_types_py` is `True`, type hints are formatted in the most
-        convenient way for the types.py file. When possible, double quotes are
-        removed from types, and for types that are in the same file the quotes
-        are kept to prevent forward references, but the "types." namespace is
+        convenient way for the types.py file. Since that module postpones the
+        evaluation of annotations, double quotes are removed from types, and
+        for types that are in the same file the "types." namespace is also
         removed. When `for_types_py` is `False`, all non-native types use
         quotes and are namespaced.
 
@@ -434,24 +436,15 @@ class ElasticsearchSchema:
                     value_type, _ = self.get_python_type(
                         behavior["generics"][1], for_response=for_response
                     )
+                    key_type = add_not_set(key_type)
+                    value_type = add_not_set(add_dict_type(value_type))
                     if for_types_py:
-                        value_type = value_type.replace('"DefaultType"', "DefaultType")
-                        value_type = value_type.replace(
-                            '"InstrumentedField"', "InstrumentedField"
-                        )
-                        value_type = re.sub(
-                            r'"(function\.[a-zA-Z0-9_]+)"', r"\1", value_type
-                        )
-                        value_type = re.sub(
-                            r'"types\.([a-zA-Z0-9_]+)"', r'"\1"', value_type
-                        )
-                        value_type = re.sub(
-                            r'"(wrappers\.[a-zA-Z0-9_]+)"', r"\1", value_type
-                        )
+                        key_type = type_for_types_py(key_type)
+                        value_type = type_for_types_py(value_type)
                     k["args"].append(
                         {
                             "name": "_field",
-                            "type": add_not_set(key_type),
+                            "type": key_type,
                             "doc": [":arg _field: The field to use in this query."],
                             "required": False,
                             "positional": True,
@@ -460,7 +453,7 @@ class ElasticsearchSchema:
                     k["args"].append(
                         {
                             "name": "_value",
-                            "type": add_not_set(add_dict_type(value_type)),
+                            "type": value_type,
                             "doc": [":arg _value: The query value for the field."],
                             "required": False,
                             "positional": True,
@@ -86,47 +86,41 @@ def main(check=False):
         for dir in source_dirs
     ]
 
+    # only files inside the source directories can match one of the rules, so
+    # there is no need to walk the rest of the tree (virtualenvs, .git, ...)
+    base_dir = Path(__file__).absolute().parent.parent
     filepaths = []
-    for root, _, filenames in os.walk(Path(__file__).absolute().parent.parent):
-        if "/site-packages" in root or "/." in root or "__pycache__" in root:
-            continue
-        for filename in filenames:
-            if filename.rpartition(".")[-1] in (
-                "py",
-                "pyi",
-            ) and not filename.startswith("utils.py"):
-                filepaths.append(os.path.join(root, filename))
+    for dir in source_dirs:
+        for root, dirnames, filenames in os.walk(base_dir / dir[0]):
+            dirnames[:] = [
+                d for d in dirnames if not d.startswith(".") and d != "__pycache__"
+            ]
+            for filename in filenames:
+                if filename.endswith((".py", ".pyi")) and not filename.startswith(
+                    "utils.py"
+                ):
+                    filepaths.append(os.path.join(root, filename))
 
     unasync.unasync_files(filepaths, rules)
-    for dir in source_dirs:
-        output_dir = f"{dir[0]}_sync_check/" if check else dir[1]
-        subprocess.check_call(["black", "--target-version=py38", output_dir])
-        subprocess.check_call(["isort", output_dir])
+    output_dirs = [f"{dir[0]}_sync_check/" if check else dir[1] for dir in source_dirs]
+    # black and isort process all the output directories in a single run,
+    # black also reformats the files in parallel
+    subprocess.check_call(["black", "--target-version=py38", *output_dirs])
+    subprocess.check_call(["isort", *output_dirs])
+    for dir, output_dir in zip(source_dirs, output_dirs):
         for file in glob("*.py", root_dir=dir[0]):
             # remove asyncio from sync files
-            subprocess.check_call(
-                ["sed", "-i.bak", "/^import asyncio$/d", f"{output_dir}{file}"]
-            )
             subprocess.check_call(
                 [
                     "sed",
                     "-i.bak",
+                    "-e",
+                    "/^import asyncio$/d",
+                    "-e",
                     "s/asyncio\\.run(main())/main()/",
-                    f"{output_dir}{file}",
-                ]
-            )
-            subprocess.check_call(
-                [
-                    "sed",
-                    "-i.bak",
+                    "-e",
                     "s/elasticsearch-dsl\\[async\\]/elasticsearch-dsl/",
-                    f"{output_dir}{file}",
-                ]
-            )
-            subprocess.check_call(
-                [
-                    "sed",
-                    "-i.bak",
+                    "-e",
                     "s/pytest.mark.asyncio/pytest.mark.sync/",
                     f"{output_dir}{file}",
                 ]
@@ -16,7 +16,8 @@
 #  under the License.
 
 import collections.abc
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,6 +30,7 @@ from typing import (
     MutableMapping,
     Optional,
     Sequence,
+    Type,
     Union,
     cast,
 )
@@ -46,11 +48,77 @@ if TYPE_CHECKING:
     from elasticsearch_dsl import types
 
 
+def _copy_agg(value: Any) -> Any:
+    """
+    Copy a JSON-like aggregation definition. Plain dicts, lists and scalars
+    are copied directly, anything else is handed over to ``deepcopy``.
+    """
+    if type(value) is dict:
+        return {k: _copy_agg(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_agg(v) for v in value]
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return deepcopy(value)
+
+
+@lru_cache(maxsize=128)
+def _get_agg_class(name: str) -> Type["Agg[Any]"]:
+    # registered aggregation classes are never replaced, so it is safe to
+    # remember the result of the registry lookup
+    return Agg.get_dsl_class(name)
+
+
+def _agg_from_dict(agg: MutableMapping[str, Any]) -> "Agg[Any]":
+    """
+    Build an aggregation out of its dict definition. The dict is consumed in
+    place, so it has to be a copy owned by the caller.
+    """
+    # should be {"terms": {"field": "tags"}}, optionally with aggs and meta
+    if len(agg) - ("aggs" in agg) - ("meta" in agg) != 1:
+        raise ValueError(
+            'A() can only accept dict with an aggregation ({"terms": {...}}). '
+            "Instead it got (%r)" % agg
+        )
+    # pop out nested aggs
+    aggs = agg.pop("aggs", None)
+    # pop out meta data
+    meta = agg.pop("meta", None)
+    agg_type, params = agg.popitem()
+    agg_class = _get_agg_class(agg_type)
+    if aggs:
+        if "aggs" in agg_class._param_defs:
+            # the nested definitions are part of the same copy, build them
+            # directly instead of having A() copy them once more
+            params["aggs"] = {
+                name: (
+                    _agg_from_dict(a)
+                    if isinstance(a, collections.abc.MutableMapping)
+                    else a
+                )
+                for name, a in aggs.items()
+            }
+        else:
+            # aggregations that don't take sub-aggregations keep them as is
+            params["aggs"] = aggs
+    if meta:
+        params["meta"] = meta
+    return agg_class(_expand__to_dot=False, **params)
+
+
 def A(
     name_or_agg: Union[MutableMapping[str, Any], "Agg[_R]", str],
     filter: Optional[Union[str, "Query"]] = None,
     **params: Any,
 ) -> "Agg[_R]":
+    # Terms(...) just return the nested agg
+    if isinstance(name_or_agg, Agg):
+        if params or filter is not None:
+            raise ValueError(
+                "A() cannot accept parameters when passing in an Agg object."
+            )
+        return name_or_agg
+
     if filter is not None:
         if name_or_agg != "filter":
             raise ValueError(
@@ -59,44 +127,24 @@ def A(
             )
         params["filter"] = filter
 
+    # "terms", field="tags"
+    if type(name_or_agg) is str:
+        return _get_agg_class(name_or_agg)(**params)
+
     # {"terms": {"field": "tags"}, "aggs": {...}}
-    if isinstance(name_or_agg, collections.abc.MutableMapping):
+    if type(name_or_agg) is dict or isinstance(
+        name_or_agg, collections.abc.MutableMapping
+    ):
         if params:
             raise ValueError("A() cannot accept parameters when passing in a dict.")
         # copy to avoid modifying in-place
-        agg = deepcopy(name_or_agg)
-        # pop out nested aggs
-        aggs = agg.pop("aggs", None)
-        # pop out meta data
-        meta = agg.pop("meta", None)
-        # should be {"terms": {"field": "tags"}}
-        if len(agg) != 1:
-            raise ValueError(
-                'A() can only accept dict with an aggregation ({"terms": {...}}). '
-                "Instead it got (%r)" % name_or_agg
-            )
-        agg_type, params = agg.popitem()
-        if aggs:
-            params = params.copy()
-            params["aggs"] = aggs
-        if meta:
-            params = params.copy()
-            params["meta"] = meta
-        return Agg[_R].get_dsl_class(agg_type)(_expand__to_dot=False, **params)
+        return _agg_from_dict(_copy_agg(name_or_agg))
 
-    # Terms(...) just return the nested agg
-    elif isinstance(name_or_agg, Agg):
-        if params:
-            raise ValueError(
-                "A() cannot accept parameters when passing in an Agg object."
-            )
-        return name_or_agg
-
-    # "terms", field="tags"
-    return Agg[_R].get_dsl_class(name_or_agg)(**params)
+    return _get_agg_class(name_or_agg)(**params)
 
 
 class Agg(DslBase, Generic[_R]):
+    __slots__ = ()
     _type_name = "agg"
     _type_shortcut = staticmethod(A)
     name = ""
@@ -106,10 +154,14 @@ class Agg(DslBase, Generic[_R]):
 
     def to_dict(self) -> Dict[str, Any]:
         d = super().to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(Dict[str, Any], d[self.name])
+        n = d[self.name]
+        if isinstance(n, dict):
+            # meta and, for bucket aggregations, sub-aggregations are
+            # serialized next to the body
             if "meta" in n:
                 d["meta"] = n.pop("meta")
+            if "aggs" in n and isinstance(self, AggBase):
+                d["aggs"] = n.pop("aggs")
         return d
 
     def result(self, search: "SearchBase[_R]", data: Dict[str, Any]) -> AttrDict[Any]:
@@ -117,6 +169,7 @@ class Agg(DslBase, Generic[_R]):
 
 
 class AggBase(Generic[_R]):
+    __slots__ = ()
     aggs: Dict[str, Agg[_R]]
     _base: Agg[_R]
     _params: Dict[str, Any]
@@ -125,27 +178,38 @@ class AggBase(Generic[_R]):
     }
 
     def __contains__(self, key: str) -> bool:
-        return key in self._params.get("aggs", {})
+        aggs = self._params.get("aggs")
+        return aggs is not None and key in aggs
 
     def __getitem__(self, agg_name: str) -> Agg[_R]:
-        agg = cast(
-            Agg[_R], self._params.setdefault("aggs", {})[agg_name]
-        )  # propagate KeyError
+        # don't materialize an empty "aggs" dict just to look into it
+        aggs = self._params.get("aggs")
+        if aggs is None:
+            raise KeyError(agg_name)
+        agg: Agg[_R] = aggs[agg_name]  # propagate KeyError
 
         # make sure we're not mutating a shared state - whenever accessing a
         # bucket, return a shallow copy of it to be safe
         if isinstance(agg, Bucket):
-            agg = A(agg.name, **agg._params)
+            agg = copy(agg)
+            # copy the containers (sub-aggregations etc.) so that changes to
+            # the copy don't leak back into the original
+            agg._params = {
+                k: v.copy() if isinstance(v, (dict, list)) else v
+                for k, v in agg._params.items()
+            }
+            agg._base = agg
             # be sure to store the copy so any modifications to it will affect us
-            self._params["aggs"][agg_name] = agg
+            aggs[agg_name] = agg
 
         return agg
 
     def __setitem__(self, agg_name: str, agg: Agg[_R]) -> None:
-        self.aggs[agg_name] = A(agg)
+        self._params.setdefault("aggs", {})[agg_name] = A(agg)
 
     def __iter__(self) -> Iterable[str]:
-        return iter(self.aggs)
+        aggs: Iterable[str] = self._params.get("aggs", ())
+        return iter(aggs)
 
     def _agg(
         self,
@@ -155,7 +219,9 @@ class AggBase(Generic[_R]):
         *args: Any,
         **params: Any,
     ) -> Agg[_R]:
-        agg = self[name] = A(agg_type, *args, **params)
+        agg = A(agg_type, *args, **params)
+        # A() has already done all the work __setitem__ would do
+        self._params.setdefault("aggs", {})[name] = agg
 
         # For chaining - when creating new buckets return them...
         if bucket:
@@ -196,22 +262,16 @@ class AggBase(Generic[_R]):
 
 
 class Bucket(AggBase[_R], Agg[_R]):
+    __slots__ = ("_base",)
+
     def __init__(self, **params: Any):
         super().__init__(**params)
         # remember self for chaining
         self._base = self
 
-    def to_dict(self) -> Dict[str, Any]:
-        d = super(AggBase, self).to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(AttrDict[Any], d[self.name])
-            if "aggs" in n:
-                d["aggs"] = n.pop("aggs")
-        return d
-
 
 class Pipeline(Agg[_R]):
-    pass
+    __slots__ = ()
 
 
 {% for k in classes %}
@@ -231,6 +291,8 @@ class {{ k.name }}({{ k.parent if k.parent else parent }}[_R]):
         {% endfor %}
     {% endif %}
     """
+
+    __slots__ = ()
     {% if k.property_name %}
     name = "{{ k.property_name }}"
     {% endif %}
@@ -246,6 +308,7 @@ class {{ k.name }}({{ k.parent if k.parent else parent }}[_R]):
     }
     {% endif %}
 
+    {% if k.args %}
     def __init__(
         self,
         {% if k.args | length != 1 %}
@@ -293,15 +356,20 @@ class {{ k.name }}({{ k.parent if k.parent else parent }}[_R]):
             {% endfor %}
             **kwargs
         )
+    {% endif %}
 
     {# what follows is a set of Pythonic enhancements to some of the query classes
        which are outside the scope of the code generator #}
     {% if k.name == "Filter" %}
     def to_dict(self) -> Dict[str, Any]:
         d = super().to_dict()
-        if isinstance(d[self.name], dict):
-            n = cast(AttrDict[Any], d[self.name])
-            n.update(n.pop("filter", {}))
+        n = d[self.name]
+        if isinstance(n, dict) and "filter" in n:
+            if len(n) == 1:
+                # the query makes up the whole body, use it as is
+                d[self.name] = n["filter"]
+            else:
+                n.update(n.pop("filter"))
         return d
 
     {% elif k.name == "Histogram" or k.name == "DateHistogram" or k.name == "AutoDateHistogram" or k.name == "VariableWidthHistogram" %}
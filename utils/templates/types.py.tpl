@@ -15,6 +15,8 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from __future__ import annotations
+
 from typing import Any, Dict, Literal, Mapping, Sequence, Union
 
 from elastic_transport.client_utils import DEFAULT, DefaultType
@@ -25,6 +27,10 @@ from elasticsearch_dsl.utils import AttrDict
 
 PipeSeparatedFlags = str
 
+# classes that inherit directly from AttrDict call its __init__ without going
+# through super()
+_attrdict_init = AttrDict.__init__
+
 
 {% for k in classes %}
 class {{ k.name }}({{ k.parent if k.parent else "AttrDict[Any]" }}):
@@ -44,6 +50,9 @@ class {{ k.name }}({{ k.parent if k.parent else "AttrDict[Any]" }}):
             {% endfor %}
         {% endfor %}
     """
+
+    __slots__ = ()
+
         {% for arg in k.args %}
             {% if arg.name not in ["keys", "items"] %}
     {{ arg.name }}: {{ arg.type }}
@@ -81,8 +90,30 @@ class {{ k.name }}({{ k.parent if k.parent else "AttrDict[Any]" }}):
             {% for arg in k.args %}
                 {% if not arg.positional %}
         if {{ arg.name }} is not DEFAULT:
-                    {% if "InstrumentedField" in arg.type %}
+                    {% if "Sequence[Union[str, InstrumentedField]]" in arg.type %}
+            kwargs["{{ arg.name }}"] = (
+                str({{ arg.name }})
+                if isinstance({{ arg.name }}, (str, InstrumentedField))
+                else [str(f) for f in {{ arg.name }}]
+            )
+                    {% elif arg.type.startswith("Union[str, InstrumentedField") %}
             kwargs["{{ arg.name }}"] = str({{ arg.name }})
+                    {% elif "Mapping[Union[str, InstrumentedField]" in arg.type %}
+            kwargs["{{ arg.name }}"] = {str(k): v for k, v in {{ arg.name }}.items()}
+                    {% elif "InstrumentedField" in arg.type and "Mapping[" not in arg.type %}
+            if isinstance({{ arg.name }}, InstrumentedField):
+                kwargs["{{ arg.name }}"] = str({{ arg.name }})
+                        {% if "Sequence[" in arg.type %}
+            elif isinstance({{ arg.name }}, (list, tuple)):
+                # only the field elements are converted, sort options and
+                # dicts are left alone
+                kwargs["{{ arg.name }}"] = [
+                    str(s) if isinstance(s, InstrumentedField) else s
+                    for s in {{ arg.name }}
+                ]
+                        {% endif %}
+            else:
+                kwargs["{{ arg.name }}"] = {{ arg.name }}
                     {% else %}
             kwargs["{{ arg.name }}"] = {{ arg.name }}
                     {% endif %}
@@ -91,7 +122,7 @@ class {{ k.name }}({{ k.parent if k.parent else "AttrDict[Any]" }}):
             {% if k.parent %}
         super().__init__(**kwargs)
             {% else %}
-        super().__init__(kwargs)
+        _attrdict_init(self, kwargs)
             {% endif %}
         {% endif %}
         {% if k.buckets_as_dict %}
@@ -101,7 +132,20 @@ class {{ k.name }}({{ k.parent if k.parent else "AttrDict[Any]" }}):
         return self.buckets  # type: ignore
         {% endif %}
     {% else %}
-    pass
+    __slots__ = ()
+        {% if not k.for_response %}
+
+            {% if k.parent %}
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+            {% else %}
+    def __init__(self, d: Union[Dict[str, Any], None] = None, **kwargs: Any):
+        # a dict passed positionally is used as the payload, like AttrDict does
+        if d is not None:
+            kwargs = {**d, **kwargs} if kwargs else d
+        _attrdict_init(self, kwargs)
+            {% endif %}
+        {% endif %}
     {% endif %}
 
 {% endfor %}